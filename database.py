@@ -2,11 +2,63 @@
 Database module - SQLite database for video metadata and thumbnails.
 """
 import sqlite3
+import functools
 import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 from settings import get_settings
+from ffmpeg_utils import ffmpeg_slots, get_ffmpeg_path
+
+try:
+    import av  # PyAV: in-process decoding for thumbnails
+except ImportError:
+    av = None
+
+
+# SQL statements, kept as constants so every call site shares one string
+SQL_INSERT = """
+    INSERT INTO videos (filename, filepath, mode, duration_seconds, file_size_bytes, thumbnail_path)
+    VALUES (?, ?, ?, ?, ?, NULL)
+"""
+SQL_SELECT_ALL = """
+    SELECT id, filename, filepath, mode, duration_seconds,
+           file_size_bytes, thumbnail_path, created_at
+    FROM videos
+    ORDER BY created_at DESC, id DESC
+    LIMIT ? OFFSET ?
+"""
+# Changes whenever a video is added or deleted or a thumbnail is set
+SQL_SELECT_SIGNATURE = "SELECT COUNT(*), MAX(id), COUNT(thumbnail_path) FROM videos"
+SQL_SELECT_ONE = """
+    SELECT id, filename, filepath, mode, duration_seconds,
+           file_size_bytes, thumbnail_path, created_at
+    FROM videos WHERE id = ?
+"""
+SQL_SELECT_ID_BY_PATH = "SELECT id FROM videos WHERE filepath = ?"
+SQL_SELECT_PATHS = "SELECT filepath FROM videos"
+SQL_SELECT_FILES_IN = "SELECT filepath, thumbnail_path FROM videos WHERE id IN ({placeholders})"
+SQL_SET_THUMBNAIL = "UPDATE videos SET thumbnail_path = ? WHERE id = ?"
+SQL_DELETE_IN = "DELETE FROM videos WHERE id IN ({placeholders})"
+
+
+def _file_size(path: str) -> int:
+    """Get a file's size with a single stat call, 0 if it doesn't exist."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _remove_file(path: str):
+    """Remove a file if present, without a separate existence check."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
 
 
 class VideoDatabase:
@@ -16,11 +68,37 @@ class VideoDatabase:
         settings = get_settings()
         self.db_path = os.path.join(settings.app_data_dir, "videos.db")
         self.thumbnails_dir = settings.thumbnails_dir
+        # Re-entrant so a bulk_mode block can hold it while calling add_video
+        self._lock = threading.RLock()
+        self._conn = None
+        self._known_paths = set()  # Mirror of videos.filepath for video_exists
+        self._bulk_thumbnails = None  # Thumbnail jobs held back by an open bulk_mode
+        
+        # Thumbnails are generated in the background so add_video returns
+        # as soon as the row is inserted
+        self._thumb_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="thumbnail")
+        self._thumbnail_listeners = []
+        
         self._init_db()
     
     def _init_db(self):
-        """Initialize the database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Open the shared connection and initialize the database schema."""
+        # One long-lived connection shared by all callers (UI and recorder
+        # threads), serialized with self._lock. Autocommit mode: each
+        # statement is its own transaction unless we BEGIN explicitly.
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        self._conn.execute("PRAGMA cache_size=-20000")
+        
+        with self._lock:
+            conn = self._conn
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS videos (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -33,11 +111,17 @@ class VideoDatabase:
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
             """)
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON videos(created_at DESC)")
-            conn.commit()
+            # Matches SQL_SELECT_ALL's order so paging walks the index
+            conn.execute("DROP INDEX IF EXISTS idx_created_at")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_created_at_id ON videos(created_at DESC, id DESC)")
+            self._known_paths = {row[0] for row in conn.execute(SQL_SELECT_PATHS)}
     
     def add_video(self, filepath: str, mode: str, duration_seconds: float = None) -> int:
-        """Add a video to the database and generate thumbnail.
+        """Add a video to the database and queue thumbnail generation.
+        
+        The row is inserted without a thumbnail; once the thumbnail has been
+        generated in the background the row is updated and any listeners
+        registered with add_thumbnail_listener are notified.
         
         Args:
             filepath: Full path to the video file
@@ -48,21 +132,142 @@ class VideoDatabase:
             The ID of the inserted video
         """
         filename = os.path.basename(filepath)
-        file_size = os.path.getsize(filepath) if os.path.exists(filepath) else 0
+        file_size = _file_size(filepath)
+        
+        with self._lock:
+            cursor = self._conn.execute(
+                SQL_INSERT, (filename, filepath, mode, duration_seconds, file_size)
+            )
+            video_id = cursor.lastrowid
+            self._known_paths.add(filepath)
+            self._queue_thumbnail(video_id, filepath)
+        
+        return video_id
+    
+    def add_videos_bulk(self, videos: List[Tuple[str, str, Optional[float]]]) -> List[int]:
+        """Add several videos in one transaction, e.g. when importing a folder.
+        
+        Args:
+            videos: List of (filepath, mode, duration_seconds) tuples
+        
+        Returns:
+            The IDs of the inserted videos, in input order
+        """
+        rows = []
+        for filepath, mode, duration_seconds in videos:
+            file_size = _file_size(filepath)
+            rows.append((os.path.basename(filepath), filepath, mode, duration_seconds, file_size))
+        
+        with self._lock:
+            with self._transaction("BEGIN IMMEDIATE"):
+                self._conn.executemany(SQL_INSERT, rows)
+                video_ids = [
+                    self._conn.execute(SQL_SELECT_ID_BY_PATH, (row[1],)).fetchone()[0]
+                    for row in rows
+                ]
+            self._known_paths.update(row[1] for row in rows)
+            for video_id, row in zip(video_ids, rows):
+                self._queue_thumbnail(video_id, row[1])
         
-        # Generate thumbnail
-        thumbnail_path = self._generate_thumbnail(filepath)
+        return video_ids
+    
+    def _queue_thumbnail(self, video_id: int, video_path: str):
+        """Start generating a video's thumbnail. Caller holds the lock.
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                INSERT INTO videos (filename, filepath, mode, duration_seconds, file_size_bytes, thumbnail_path)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (filename, filepath, mode, duration_seconds, file_size, thumbnail_path))
-            conn.commit()
-            return cursor.lastrowid
+        Inside bulk_mode the job is held back until the block commits, so a
+        rolled-back row (whose id may be reused) never gets a thumbnail.
+        """
+        if self._bulk_thumbnails is not None:
+            self._bulk_thumbnails.append((video_id, video_path))
+        else:
+            self._thumb_pool.submit(self._generate_thumbnail_for, video_id, video_path)
+    
+    @contextmanager
+    def _transaction(self, begin: str = "BEGIN"):
+        """Run the enclosed statements in one transaction. Caller holds the lock.
+        
+        If a transaction is already open (e.g. inside bulk_mode) the statements
+        simply join it.
+        """
+        if self._conn.in_transaction:
+            yield
+            return
+        
+        self._conn.execute(begin)
+        try:
+            yield
+        except:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+    
+    @contextmanager
+    def bulk_mode(self):
+        """Relax durability and batch all writes into one transaction.
+        
+        For bulk imports, e.g. rescanning the output folder:
+        
+            with db.bulk_mode():
+                for path in paths:
+                    db.add_video(path, "fulltime")
+        
+        A crash inside the block can lose the whole batch, so only use it for
+        data that can be re-imported. The lock is held for the whole block,
+        so other threads' database calls wait for it instead of joining the
+        relaxed transaction. Thumbnails are only generated once it commits.
+        """
+        with self._lock:
+            known_paths = set(self._known_paths)
+            try:
+                self._conn.execute("PRAGMA synchronous=OFF")
+                self._conn.execute("PRAGMA journal_mode=MEMORY")
+                self._conn.execute("BEGIN")
+                self._bulk_thumbnails = []
+                try:
+                    yield self
+                except:
+                    self._conn.execute("ROLLBACK")
+                    # The rolled-back rows' paths are gone again
+                    self._known_paths = known_paths
+                    raise
+                self._conn.execute("COMMIT")
+                for video_id, video_path in self._bulk_thumbnails:
+                    self._thumb_pool.submit(self._generate_thumbnail_for, video_id, video_path)
+            finally:
+                self._bulk_thumbnails = None
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.execute("PRAGMA journal_mode=WAL")
+    
+    def add_thumbnail_listener(self, callback: Callable[[int, str], None]):
+        """Register a callback invoked when a video's thumbnail is ready.
+        
+        The callback is called from a worker thread with (video_id, thumbnail_path),
+        so UI code must marshal it back onto its own thread.
+        """
+        self._thumbnail_listeners.append(callback)
+    
+    def _generate_thumbnail_for(self, video_id: int, video_path: str):
+        """Worker task: generate a thumbnail and attach it to the video row."""
+        thumbnail_path = self._generate_thumbnail(video_path)
+        if not thumbnail_path:
+            return
+        
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.execute(SQL_SET_THUMBNAIL, (thumbnail_path, video_id))
+        
+        for callback in self._thumbnail_listeners:
+            try:
+                callback(video_id, thumbnail_path)
+            except Exception as e:
+                print(f"Error in thumbnail listener: {e}")
     
     def _generate_thumbnail(self, video_path: str) -> Optional[str]:
-        """Generate a thumbnail for a video using FFmpeg.
+        """Generate a thumbnail for a video.
+        
+        Decodes in-process with PyAV when it is installed, otherwise (or if
+        that fails) shells out to FFmpeg.
         
         Args:
             video_path: Path to the video file
@@ -77,32 +282,59 @@ class VideoDatabase:
         video_name = os.path.splitext(os.path.basename(video_path))[0]
         thumbnail_path = os.path.join(self.thumbnails_dir, f"{video_name}.jpg")
         
+        if av is not None:
+            try:
+                if self._generate_thumbnail_av(video_path, thumbnail_path):
+                    return thumbnail_path
+            except Exception as e:
+                print(f"Error generating thumbnail with PyAV: {e}")
+        
+        return self._generate_thumbnail_ffmpeg(video_path, thumbnail_path)
+    
+    def _generate_thumbnail_av(self, video_path: str, thumbnail_path: str) -> bool:
+        """Decode one keyframe near 1 second with PyAV and save it as a 160x90 JPEG.
+        
+        Returns:
+            True if the thumbnail was written
+        """
+        with av.open(video_path) as container:
+            stream = container.streams.video[0]
+            stream.codec_context.skip_frame = "NONKEY"
+            container.seek(int(1 / stream.time_base), stream=stream)
+            for frame in container.decode(stream):
+                frame.reformat(width=160, height=90, interpolation="FAST_BILINEAR").to_image().save(thumbnail_path, quality=75)
+                return True
+        return False
+    
+    def _generate_thumbnail_ffmpeg(self, video_path: str, thumbnail_path: str) -> Optional[str]:
+        """Generate a thumbnail by running the FFmpeg CLI.
+        
+        Returns:
+            Path to the generated thumbnail, or None if failed
+        """
         try:
-            # Check local ffmpeg
-            ffmpeg_cmd = "ffmpeg"
-            # Assumes database.py is in root folder
-            local_ffmpeg = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ffmpeg", "ffmpeg.exe")
-            if os.path.exists(local_ffmpeg):
-                ffmpeg_cmd = local_ffmpeg
-
-            # Extract frame at 1 second, resize to 160x90
+            # Extract frame at 1 second (input-side seek), resize to 160x90
             cmd = [
-                ffmpeg_cmd,
+                get_ffmpeg_path(),
+                "-hide_banner", "-loglevel", "error", "-nostats",
                 "-y",
+                "-threads", "2",
                 "-ss", "1",
                 "-i", video_path,
-                "-vframes", "1",
-                "-vf", "scale=160:90",
+                "-an", "-sn", "-dn",    # Video only; don't demux other streams
+                "-frames:v", "1",
+                "-vf", "scale=160:90:flags=fast_bilinear",
                 "-q:v", "5",
                 thumbnail_path
             ]
-            subprocess.run(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-                timeout=10
-            )
+            with ffmpeg_slots:
+                subprocess.run(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    creationflags=subprocess.CREATE_NO_WINDOW,
+                    timeout=10
+                )
             
             if os.path.exists(thumbnail_path):
                 return thumbnail_path
@@ -111,29 +343,36 @@ class VideoDatabase:
         
         return None
     
-    def get_videos(self) -> List[Tuple]:
-        """Get all videos sorted by creation date (newest first).
+    def get_videos(self, limit: Optional[int] = None, offset: int = 0) -> List[Tuple]:
+        """Get videos sorted by creation date (newest first).
+        
+        Args:
+            limit: Maximum number of rows to return (None for all)
+            offset: Number of rows to skip, for paging through the list
         
         Returns:
             List of tuples: (id, filename, filepath, mode, duration, size, thumbnail, created_at)
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT id, filename, filepath, mode, duration_seconds, 
-                       file_size_bytes, thumbnail_path, created_at
-                FROM videos
-                ORDER BY created_at DESC
-            """)
+        with self._lock:
+            cursor = self._conn.execute(
+                SQL_SELECT_ALL, (-1 if limit is None else limit, offset)
+            )
             return cursor.fetchall()
     
+    def get_videos_signature(self) -> Tuple:
+        """Get a cheap summary of the videos table for change detection.
+        
+        Returns:
+            Tuple of (row count, max id, thumbnail count); equal signatures
+            mean get_videos would return the same rows
+        """
+        with self._lock:
+            return self._conn.execute(SQL_SELECT_SIGNATURE).fetchone()
+    
     def get_video(self, video_id: int) -> Optional[Tuple]:
         """Get a single video by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT id, filename, filepath, mode, duration_seconds,
-                       file_size_bytes, thumbnail_path, created_at
-                FROM videos WHERE id = ?
-            """, (video_id,))
+        with self._lock:
+            cursor = self._conn.execute(SQL_SELECT_ONE, (video_id,))
             return cursor.fetchone()
     
     def delete_video(self, video_id: int, delete_file: bool = False):
@@ -143,45 +382,56 @@ class VideoDatabase:
             video_id: ID of the video to delete
             delete_file: If True, also delete the video file and thumbnail
         """
+        self.delete_videos([video_id], delete_file=delete_file)
+    
+    def delete_videos(self, video_ids: List[int], delete_file: bool = False):
+        """Delete several videos from the database in a single transaction.
+        
+        Args:
+            video_ids: IDs of the videos to delete
+            delete_file: If True, also delete the video files and thumbnails
+        """
+        if not video_ids:
+            return
+        
+        placeholders = ",".join("?" * len(video_ids))
+        
+        with self._lock:
+            rows = self._conn.execute(
+                SQL_SELECT_FILES_IN.format(placeholders=placeholders), video_ids
+            ).fetchall()
+        
         if delete_file:
-            video = self.get_video(video_id)
-            if video:
-                filepath = video[2]
-                thumbnail = video[6]
-                
+            for filepath, thumbnail in rows:
                 # Delete video file
-                if filepath and os.path.exists(filepath):
-                    try:
-                        os.remove(filepath)
-                    except:
-                        pass
+                if filepath:
+                    _remove_file(filepath)
                 
                 # Delete thumbnail
-                if thumbnail and os.path.exists(thumbnail):
-                    try:
-                        os.remove(thumbnail)
-                    except:
-                        pass
+                if thumbnail:
+                    _remove_file(thumbnail)
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("DELETE FROM videos WHERE id = ?", (video_id,))
-            conn.commit()
+        with self._lock:
+            with self._transaction():
+                self._conn.execute(SQL_DELETE_IN.format(placeholders=placeholders), video_ids)
+            self._known_paths.difference_update(row[0] for row in rows)
     
     def video_exists(self, filepath: str) -> bool:
         """Check if a video already exists in the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM videos WHERE filepath = ?", (filepath,)
-            )
-            return cursor.fetchone() is not None
+        with self._lock:
+            return filepath in self._known_paths
+    
+    def close(self):
+        """Stop the thumbnail workers and close the database connection."""
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
 
 # Global database instance
-_db_instance = None
-
+@functools.cache
 def get_database() -> VideoDatabase:
     """Get the global database instance."""
-    global _db_instance
-    if _db_instance is None:
-        _db_instance = VideoDatabase()
-    return _db_instance
+    return VideoDatabase()
@@ -0,0 +1,20 @@
+"""
+FFmpeg utilities - Shared helpers for locating and running FFmpeg.
+"""
+import os
+import threading
+
+
+# Limits how many short-lived FFmpeg jobs (thumbnails, buffer concat) run at
+# once so a batch of them can't flood the CPU. The long-running capture
+# process is not counted.
+ffmpeg_slots = threading.BoundedSemaphore(max(1, (os.cpu_count() or 2) // 2))
+
+
+def get_ffmpeg_path() -> str:
+    """Get path to ffmpeg executable, preferring local 'ffmpeg' folder."""
+    # Check local folder first (next to this module)
+    local_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ffmpeg", "ffmpeg.exe")
+    if os.path.exists(local_path):
+        return local_path
+    return "ffmpeg"
@@ -0,0 +1,98 @@
+"""
+Hotkeys module - Global hotkeys using the Win32 RegisterHotKey API.
+Windows only delivers the registered key combinations to us, instead of
+every keystroke as with a low-level keyboard hook. Unlike such a hook, a
+registered hotkey is consumed: the foreground app never receives it.
+"""
+import ctypes
+import threading
+from ctypes import wintypes
+
+# Modifier flags for RegisterHotKey
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_NOREPEAT = 0x4000
+
+# Virtual-key codes
+VK_F9 = 0x78
+VK_F10 = 0x79
+VK_Q = 0x51
+
+# Window messages
+WM_QUIT = 0x0012
+WM_HOTKEY = 0x0312
+
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+user32.RegisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT]
+user32.RegisterHotKey.restype = wintypes.BOOL
+user32.UnregisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int]
+user32.UnregisterHotKey.restype = wintypes.BOOL
+user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+user32.GetMessageW.restype = wintypes.BOOL
+user32.PostThreadMessageW.argtypes = [wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+user32.PostThreadMessageW.restype = wintypes.BOOL
+kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+
+
+class HotkeyListener:
+    """Registers global hotkeys and dispatches them from a message-loop thread."""
+
+    def __init__(self):
+        self._hotkeys = []  # (modifiers, vk, callback); hotkey id = index + 1
+        self._thread = None
+        self._thread_id = None
+        self._ready = threading.Event()
+
+    def add_hotkey(self, modifiers: int, vk: int, callback):
+        """Add a hotkey. Must be called before start().
+
+        Args:
+            modifiers: Combination of MOD_* flags (0 for none)
+            vk: Virtual-key code
+            callback: Called with no arguments from the listener thread
+        """
+        self._hotkeys.append((modifiers, vk, callback))
+
+    def start(self):
+        """Register the hotkeys and start dispatching them."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=1)
+
+    def stop(self):
+        """Unregister the hotkeys and stop the listener thread."""
+        if self._thread_id is not None:
+            user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+            self._thread_id = None
+
+    def _run(self):
+        """Message loop. Hotkeys are bound to the thread that registers them."""
+        self._thread_id = kernel32.GetCurrentThreadId()
+
+        registered = []
+        for hotkey_id, (modifiers, vk, _) in enumerate(self._hotkeys, start=1):
+            if user32.RegisterHotKey(None, hotkey_id, modifiers | MOD_NOREPEAT, vk):
+                registered.append(hotkey_id)
+            else:
+                error = ctypes.get_last_error()
+                print(f"Warning: RegisterHotKey failed for vk {vk:#x} with error {error}")
+        self._ready.set()
+
+        msg = wintypes.MSG()
+        try:
+            # GetMessageW returns 0 on WM_QUIT and -1 on error
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message != WM_HOTKEY:
+                    continue
+                index = msg.wParam - 1
+                if 0 <= index < len(self._hotkeys):
+                    try:
+                        self._hotkeys[index][2]()
+                    except Exception as e:
+                        print(f"Error in hotkey callback: {e}")
+        finally:
+            for hotkey_id in registered:
+                user32.UnregisterHotKey(None, hotkey_id)
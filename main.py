@@ -7,8 +7,10 @@ Hotkeys:
   F10 - Toggle buffer mode (start buffer / save buffer)
   Ctrl+Shift+Q - Quit application
 """
-import keyboard
+import ctypes
 import sys
+import threading
+from hotkeys import HotkeyListener, MOD_CONTROL, MOD_SHIFT, VK_F9, VK_F10, VK_Q
 from overlay import Overlay
 from recorder import ScreenRecorder
 from ui.main_window import MainWindow
@@ -17,7 +19,11 @@ from ui.main_window import MainWindow
 class ScreenRecorderApp:
     """Main application class that coordinates overlay, recorder, and hotkeys."""
     
+    # How often quitting checks whether background saves have finished
+    QUIT_POLL_MS = 100
+    
     def __init__(self):
+        self._quitting = False
         self.recorder = ScreenRecorder()
         
         # Create main window first (it owns the Tk root)
@@ -35,10 +41,13 @@ class ScreenRecorderApp:
     
     def _setup_hotkeys(self):
         """Register global hotkeys."""
-        # Note: suppress=False to avoid conflicts with other keyboard apps
-        keyboard.add_hotkey('F9', self._on_fulltime_hotkey)
-        keyboard.add_hotkey('F10', self._on_buffer_hotkey)
-        keyboard.add_hotkey('ctrl+shift+q', self._on_quit_hotkey)
+        # Registered hotkeys are consumed: while the app runs, other apps
+        # (games, debuggers) no longer receive F9/F10 or Ctrl+Shift+Q
+        self.hotkeys = HotkeyListener()
+        self.hotkeys.add_hotkey(0, VK_F9, self._on_fulltime_hotkey)
+        self.hotkeys.add_hotkey(0, VK_F10, self._on_buffer_hotkey)
+        self.hotkeys.add_hotkey(MOD_CONTROL | MOD_SHIFT, VK_Q, self._on_quit_hotkey)
+        self.hotkeys.start()
     
     def _on_fulltime_hotkey(self):
         """Handle F9 - Toggle fulltime recording."""
@@ -50,15 +59,15 @@ class ScreenRecorderApp:
     
     def _on_quit_hotkey(self):
         """Handle Ctrl+Shift+Q - Quit application."""
-        self.main_window.schedule(0, self._quit)
+        self.main_window.schedule(0, self.main_window.close)
     
     def _toggle_fulltime(self):
         """Toggle fulltime recording mode."""
         if self.recorder.get_mode() == "fulltime":
-            output = self.recorder.stop_fulltime()
+            future = self.recorder.stop_fulltime()
             self.overlay.update_status("idle", False)
-            if output:
-                self.main_window.refresh_videos()
+            if future:
+                future.add_done_callback(self._on_recording_saved)
         elif self.recorder.get_mode() is None:
             if self.recorder.start_fulltime():
                 self.overlay.update_status("fulltime", True)
@@ -66,28 +75,52 @@ class ScreenRecorderApp:
     def _toggle_buffer(self):
         """Toggle buffer recording mode."""
         if self.recorder.get_mode() == "buffer":
-            output = self.recorder.save_buffer()
+            future = self.recorder.save_buffer()
             self.overlay.update_status("idle", False)
-            if output:
-                self.main_window.refresh_videos()
+            if future:
+                future.add_done_callback(self._on_recording_saved)
         elif self.recorder.get_mode() is None:
             if self.recorder.start_buffer():
                 self.overlay.update_status("buffer", True)
     
+    def _on_recording_saved(self, future):
+        """Refresh the videos list once a recording is saved (worker thread)."""
+        if future.result():
+            self.main_window.schedule(0, self.main_window.refresh_videos)
+    
     def _quit(self):
         """Quit the application."""
+        if self._quitting:
+            return
+        self._quitting = True
+        
         # Stop any recording
         if self.recorder.get_mode() == "fulltime":
             self.recorder.stop_fulltime()
         elif self.recorder.get_mode() == "buffer":
             self.recorder.cancel_buffer()
         
+        self.hotkeys.stop()
+        
+        # Saves still finishing call back into Tk when done, so wait for them
+        # on another thread and keep the Tk event loop running meanwhile
+        waiter = threading.Thread(target=self.recorder.shutdown, daemon=True)
+        waiter.start()
+        self._finish_quit(waiter)
+    
+    def _finish_quit(self, waiter):
+        """Clean up once background saves have finished (polled on the Tk thread)."""
+        if waiter.is_alive():
+            self.main_window.schedule(self.QUIT_POLL_MS, lambda: self._finish_quit(waiter))
+            return
+        
         # Cleanup
-        keyboard.unhook_all()
+        self.recorder.db.close()
         try:
             self.overlay.quit()
         except:
             pass
+        self.main_window.destroy()
     
     def run(self):
         """Start the application."""
@@ -105,7 +138,17 @@ class ScreenRecorderApp:
         self.main_window.run()
 
 
+def _enable_dpi_awareness():
+    """Opt into per-monitor DPI awareness so window positions use real pixels."""
+    # DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2 = -4
+    try:
+        ctypes.windll.user32.SetProcessDpiAwarenessContext(ctypes.c_void_p(-4))
+    except Exception as e:
+        print(f"Warning: Could not set DPI awareness: {e}")
+
+
 def main():
+    _enable_dpi_awareness()
     app = ScreenRecorderApp()
     app.run()
 
@@ -10,10 +10,29 @@ from ctypes import wintypes
 WDA_EXCLUDEFROMCAPTURE = 0x00000011
 WDA_NONE = 0x00000000
 
+# GetAncestor flag
+GA_ROOT = 2
+
+# Define argument types once for 64-bit compatibility
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+user32.GetParent.argtypes = [wintypes.HWND]
+user32.GetParent.restype = wintypes.HWND
+user32.GetAncestor.argtypes = [wintypes.HWND, ctypes.c_uint]
+user32.GetAncestor.restype = wintypes.HWND
+user32.SetWindowDisplayAffinity.argtypes = [wintypes.HWND, wintypes.DWORD]
+user32.SetWindowDisplayAffinity.restype = wintypes.BOOL
+
 
 class Overlay:
     """A small overlay window that shows recording status."""
     
+    # (text, color) shown for each recording mode
+    STATUS_DISPLAY = {
+        "idle": ("● IDLE", "#888888"),
+        "fulltime": ("● REC", "#ff4444"),
+        "buffer": ("● BUF", "#44aaff"),
+    }
+    
     def __init__(self, master=None):
         """Initialize overlay.
         
@@ -54,30 +73,23 @@ class Overlay:
             bg="#1a1a2e"
         )
         self.status_label.pack(expand=True, fill="both")
+        self._last_display = self.STATUS_DISPLAY["idle"]
         
-        # Exclude from capture after window is created
-        self.root.after(100, self._set_capture_exclusion)
+        # Force the native window to exist, then exclude it from capture
+        # right away so no captured frame ever contains the overlay
+        self.root.update_idletasks()
+        self._set_capture_exclusion()
     
     def _set_capture_exclusion(self):
         """Set window display affinity to exclude from screen capture."""
         try:
-            # Define argument types for 64-bit compatibility
-            user32 = ctypes.windll.user32
-            user32.GetParent.argtypes = [wintypes.HWND]
-            user32.GetParent.restype = wintypes.HWND
-            user32.GetAncestor.argtypes = [wintypes.HWND, ctypes.c_uint]
-            user32.GetAncestor.restype = wintypes.HWND
-            user32.SetWindowDisplayAffinity.argtypes = [wintypes.HWND, ctypes.c_DWORD]
-            user32.SetWindowDisplayAffinity.restype = wintypes.BOOL
-            
             hwnd = user32.GetParent(self.root.winfo_id())
-            if hwnd == 0:
+            if not hwnd:
                 # Try getting the root window handle differently
                 hwnd = self.root.winfo_id()
             
             # Get the actual top-level window
-            # GA_ROOT = 2
-            hwnd = user32.GetAncestor(hwnd, 2)
+            hwnd = user32.GetAncestor(hwnd, GA_ROOT)
             
             result = user32.SetWindowDisplayAffinity(
                 hwnd, WDA_EXCLUDEFROMCAPTURE
@@ -95,12 +107,17 @@ class Overlay:
             mode: 'fulltime', 'buffer', or 'idle'
             is_active: Whether recording is currently active
         """
-        if mode == "idle" or not is_active:
-            self.status_label.config(text="● IDLE", fg="#888888")
-        elif mode == "fulltime":
-            self.status_label.config(text="● REC", fg="#ff4444")
-        elif mode == "buffer":
-            self.status_label.config(text="● BUF", fg="#44aaff")
+        if not is_active:
+            mode = "idle"
+        display = self.STATUS_DISPLAY.get(mode)
+        
+        # Skip the widget update when nothing visible changes
+        if display is None or display == self._last_display:
+            return
+        
+        text, color = display
+        self.status_label.config(text=text, fg=color)
+        self._last_display = display
     
     def run(self):
         """Start the Tkinter main loop."""
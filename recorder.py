@@ -5,17 +5,44 @@ Supports two modes:
 2. Buffer: Rolling buffer that can be saved on demand
 """
 import subprocess
+import csv
+import ctypes
+import hashlib
 import os
+import shutil
+import signal
+import threading
 import time
-import glob
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from settings import get_settings
 from database import get_database
+from ffmpeg_utils import ffmpeg_slots, get_ffmpeg_path
+
+try:
+    import av  # PyAV: in-process remuxing for buffer saves
+except ImportError:
+    av = None
+
+try:
+    import sounddevice  # PortAudio: in-process audio device enumeration
+except ImportError:
+    sounddevice = None
 
 
 class ScreenRecorder:
     """Screen recorder using FFmpeg with fulltime and buffer modes."""
     
+    FRAMERATE = 60
+    # Desktop Duplication frames live on the GPU as D3D11 textures
+    DDAGRAB_GPU_FILTER = f"ddagrab=framerate={FRAMERATE}"
+    # Download them so any encoder can consume them
+    DDAGRAB_FILTER = f"{DDAGRAB_GPU_FILTER},hwdownload,format=bgra"
+    # Encoders that take the D3D11 textures directly (no download)
+    D3D11_ENCODERS = ("h264_nvenc",)
+    # FFmpeg's record of the segments in the buffer ring, oldest first
+    SEGMENT_LIST_NAME = "buffer_list.csv"
+    
     def __init__(self):
         """Initialize the recorder using settings."""
         self.settings = get_settings()
@@ -23,6 +50,7 @@ class ScreenRecorder:
         
         # State
         self.current_mode = None  # 'fulltime', 'buffer', or None
+        self._mode_listeners = []
         self.ffmpeg_process = None
         self.current_output_file = None
         self._buffer_start_time = None
@@ -30,23 +58,42 @@ class ScreenRecorder:
         # Segment duration for buffer
         self.segment_duration = 10  # 10-second segments
         
+        # Buffer directory lives under app data, which never moves at runtime
+        self._buffer_dir = os.path.join(self.settings.app_data_dir, ".buffer")
+        os.makedirs(self._buffer_dir, exist_ok=True)
+        
+        # Finishes saved recordings (concat, database) off the caller's thread.
+        # One worker keeps saves in order.
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recorder-io")
+        
+        # Stopping FFmpeg also runs on the worker; a new recording can't
+        # start until the previous FFmpeg has exited and freed the buffer
+        self._ffmpeg_stopped = threading.Event()
+        self._ffmpeg_stopped.set()
+        
+        # Only a console this process has can deliver CTRL_BREAK_EVENT to
+        # FFmpeg (e.g. when run from a terminal, not the windowed build)
+        self._has_console = bool(ctypes.windll.kernel32.GetConsoleWindow())
+        
+        # Remove staging directories left behind by saves that never finished
+        self._io_pool.submit(self._remove_stale_staging)
+        
         # Find ffmpeg binary (prefer local)
-        self.ffmpeg_path = self._get_ffmpeg_path()
+        self.ffmpeg_path = get_ffmpeg_path()
         print(f"Using FFmpeg: {self.ffmpeg_path}")
         
-        # Detect audio device
-        self._audio_device = self._detect_audio_device()
+        # Detect audio device, capture source and hardware encoder, reusing the
+        # results of a previous launch when FFmpeg and the GPUs are unchanged
+        self._load_or_detect_devices()
         
-        # Detect hardware encoder
-        self._hw_encoder = self._detect_hw_encoder()
-    
-    def _get_ffmpeg_path(self) -> str:
-        """Get path to ffmpeg executable, preferring local 'ffmpeg' folder."""
-        # Check local folder first
-        local_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ffmpeg", "ffmpeg.exe")
-        if os.path.exists(local_path):
-            return local_path
-        return "ffmpeg"
+        # With a verified ddagrab-to-encoder pipeline, frames never leave the GPU
+        self._capture_input = self._build_capture_input(self._capture_source, self._gpu_frames)
+        
+        # Build the encoder arguments once
+        self._encoder_args = self._build_encoder_args(self._hw_encoder, self._gpu_frames)
+        
+        # Everything up to the output options is fixed for the session
+        self._capture_cmd = self._build_capture_cmd()
     
     def _detect_audio_device(self) -> str:
         """Detect available audio capture device.
@@ -55,34 +102,11 @@ class ScreenRecorder:
             Name of audio device for FFmpeg, or None if not available.
         """
         try:
-            # List DirectShow audio devices
-            result = subprocess.run(
-                [self.ffmpeg_path, "-list_devices", "true", "-f", "dshow", "-i", "dummy"],
-                capture_output=True,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-                timeout=5
-            )
-            
-            output = result.stderr
+            audio_devices = self._list_audio_devices()
             
             # Priority devices for system audio capture
             priority_names = ["Stereo Mix", "What U Hear", "CABLE Output", "Loopback"]
             
-            audio_devices = []
-            
-            # Parse FFmpeg output - look for lines with (audio)
-            for line in output.split('\n'):
-                if '(audio)' in line and '"' in line:
-                    # Extract device name between quotes
-                    start = line.find('"') + 1
-                    end = line.find('"', start)
-                    if start > 0 and end > start:
-                        device_name = line[start:end]
-                        if device_name and not device_name.startswith("@"):
-                            audio_devices.append(device_name)
-                            print(f"Found audio device: {device_name}")
-            
             # Find best match by priority
             for priority in priority_names:
                 for device in audio_devices:
@@ -101,6 +125,210 @@ class ScreenRecorder:
         print("No audio capture device found - recording without audio")
         return None
     
+    def _list_audio_devices(self) -> list:
+        """List audio capture device names usable with FFmpeg's dshow input.
+        
+        Uses PortAudio (sounddevice) in-process when installed, otherwise
+        parses FFmpeg's DirectShow device listing.
+        
+        Returns:
+            List of device names
+        """
+        if sounddevice is not None:
+            try:
+                devices = self._list_audio_devices_portaudio()
+                if devices:
+                    return devices
+            except Exception as e:
+                print(f"Error listing audio devices with sounddevice: {e}")
+        return self._list_audio_devices_ffmpeg()
+    
+    def _list_audio_devices_portaudio(self) -> list:
+        """List capture devices through PortAudio's WASAPI host API.
+        
+        WASAPI reports the same full endpoint names DirectShow uses (MME
+        truncates them to 31 characters).
+        """
+        wasapi = [
+            index for index, api in enumerate(sounddevice.query_hostapis())
+            if "WASAPI" in api["name"]
+        ]
+        
+        audio_devices = []
+        for device in sounddevice.query_devices():
+            if device["hostapi"] in wasapi and device["max_input_channels"] > 0:
+                audio_devices.append(device["name"])
+                print(f"Found audio device: {device['name']}")
+        return audio_devices
+    
+    def _list_audio_devices_ffmpeg(self) -> list:
+        """List capture devices by parsing FFmpeg's DirectShow device listing."""
+        result = subprocess.run(
+            [self.ffmpeg_path, "-list_devices", "true", "-f", "dshow", "-i", "dummy"],
+            capture_output=True,
+            text=True,
+            creationflags=subprocess.CREATE_NO_WINDOW,
+            timeout=5
+        )
+        
+        audio_devices = []
+        
+        # Parse FFmpeg output - look for lines with (audio)
+        for line in result.stderr.split('\n'):
+            if '(audio)' in line and '"' in line:
+                # Extract device name between quotes
+                start = line.find('"') + 1
+                end = line.find('"', start)
+                if start > 0 and end > start:
+                    device_name = line[start:end]
+                    if device_name and not device_name.startswith("@"):
+                        audio_devices.append(device_name)
+                        print(f"Found audio device: {device_name}")
+        return audio_devices
+    
+    def _load_or_detect_devices(self):
+        """Set audio device, capture source and encoder from cache or by probing.
+        
+        The audio device is never cached: endpoints come and go without the
+        fingerprint changing, and listing them is cheap.
+        """
+        fingerprint = self._detection_fingerprint()
+        if fingerprint and self.settings.get("detection_fingerprint") == fingerprint:
+            self._capture_source = self.settings.get("cached_capture_source")
+            self._hw_encoder = self.settings.get("cached_hw_encoder")
+            self._gpu_frames = self.settings.get("cached_gpu_frames")
+            if self._capture_source and self._hw_encoder and self._gpu_frames is not None:
+                print(f"Using cached device detection: capture={self._capture_source}, "
+                      f"encoder={self._hw_encoder}, gpu_frames={self._gpu_frames}")
+                self._audio_device = self._detect_audio_device()
+                return
+        
+        # The probes are independent and mostly wait on FFmpeg, so run them together
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            audio = pool.submit(self._detect_audio_device)
+            capture = pool.submit(self._detect_capture_source)
+            encoder = pool.submit(self._detect_hw_encoder)
+            self._audio_device = audio.result()
+            self._capture_source = capture.result()
+            self._hw_encoder = encoder.result()
+        
+        # Only probed once both are known: the combination itself can fail,
+        # e.g. on hybrid-GPU laptops where the display's GPU isn't NVENC's
+        self._gpu_frames = (self._capture_source == "ddagrab"
+                            and self._hw_encoder in self.D3D11_ENCODERS
+                            and self._probe_gpu_frames(self._hw_encoder))
+        
+        self.settings.update({
+            "detection_fingerprint": fingerprint,
+            "cached_capture_source": self._capture_source,
+            "cached_hw_encoder": self._hw_encoder,
+            "cached_gpu_frames": self._gpu_frames,
+        })
+    
+    def _detection_fingerprint(self) -> str:
+        """Hash the FFmpeg build and installed GPUs.
+        
+        Device detection results stay valid as long as this doesn't change.
+        
+        Returns:
+            Hex digest, or None if FFmpeg could not be queried.
+        """
+        digest = hashlib.sha1()
+        try:
+            result = subprocess.run(
+                [self.ffmpeg_path, "-version"],
+                capture_output=True,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+                timeout=3
+            )
+            digest.update(result.stdout)
+        except Exception as e:
+            print(f"Error reading FFmpeg version: {e}")
+            return None
+        
+        try:
+            result = subprocess.run(
+                ["wmic", "path", "win32_VideoController", "get", "name"],
+                capture_output=True,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+                timeout=3
+            )
+            digest.update(result.stdout)
+        except Exception as e:
+            # Without GPU names the FFmpeg build alone keys the cache
+            print(f"Warning: Could not list video controllers: {e}")
+        
+        return digest.hexdigest()
+    
+    def _build_capture_input(self, source: str, gpu_frames: bool = False) -> list:
+        """Build FFmpeg input arguments for a capture source.
+        
+        Args:
+            source: 'ddagrab' or 'gdigrab'
+            gpu_frames: Keep ddagrab frames on the GPU for the encoder
+            
+        Returns:
+            FFmpeg input arguments as list
+        """
+        if source == "ddagrab":
+            capture_filter = self.DDAGRAB_GPU_FILTER if gpu_frames else self.DDAGRAB_FILTER
+            return ["-f", "lavfi", "-i", capture_filter]
+        return ["-f", "gdigrab", "-framerate", str(self.FRAMERATE), "-i", "desktop"]
+    
+    def _detect_capture_source(self) -> str:
+        """Pick the screen capture source.
+        
+        Prefers the ddagrab filter (DXGI Desktop Duplication), which avoids
+        the GDI BitBlt copy that gdigrab does for every frame. Falls back to
+        gdigrab when this FFmpeg build or the driver doesn't support it.
+        
+        Returns:
+            'ddagrab' or 'gdigrab'
+        """
+        try:
+            result = subprocess.run(
+                [self.ffmpeg_path, "-f", "lavfi", "-i", self.DDAGRAB_FILTER,
+                 "-frames:v", "1", "-f", "null", "-"],
+                capture_output=True,
+                text=True,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+                timeout=5
+            )
+            if result.returncode == 0:
+                print("Using Desktop Duplication capture (ddagrab)")
+                return "ddagrab"
+        except Exception as e:
+            print(f"Error testing ddagrab capture: {e}")
+        
+        print("Using GDI capture (gdigrab)")
+        return "gdigrab"
+    
+    def _probe_gpu_frames(self, encoder: str) -> bool:
+        """Test encoding ddagrab's D3D11 frames directly, without a download.
+        
+        Args:
+            encoder: Encoder from D3D11_ENCODERS
+            
+        Returns:
+            True if FFmpeg encoded a frame through the exact GPU pipeline
+        """
+        try:
+            result = subprocess.run(
+                [self.ffmpeg_path, "-f", "lavfi", "-i", self.DDAGRAB_GPU_FILTER,
+                 "-frames:v", "1", "-c:v", encoder, "-f", "null", "-"],
+                capture_output=True,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+                timeout=5
+            )
+            if result.returncode == 0:
+                print(f"Capturing straight into {encoder} on the GPU")
+                return True
+        except Exception as e:
+            print(f"Error testing GPU capture into {encoder}: {e}")
+        
+        print(f"GPU capture into {encoder} failed; downloading frames instead")
+        return False
+    
     def _detect_hw_encoder(self) -> str:
         """Detect available and working hardware encoder.
         
@@ -114,113 +342,207 @@ class ScreenRecorder:
             ("h264_qsv", "Intel"),
         ]
         
+        # Skip test encodes for encoders this FFmpeg build doesn't include
+        available = self._list_encoders()
+        if available is not None:
+            hw_encoders = [(e, n) for e, n in hw_encoders if e in available]
+        
+        # Test all candidates at once (drivers might be too old), then take
+        # the highest-priority one that worked. Each encodes 1 frame of blank
+        # video (needs meaningful size for NVENC).
+        probes = []
         for encoder, name in hw_encoders:
+            cmd = [
+                self.ffmpeg_path, 
+                "-f", "lavfi", "-i", "color=c=black:s=640x360", 
+                "-frames:v", "1", 
+                "-c:v", encoder, 
+                "-f", "null", "-"
+            ]
             try:
-                # Test if the encoder actually works (driver might be too old)
-                # Try to encode 1 frame of blank video (needs meaningful size for NVENC)
-                cmd = [
-                    self.ffmpeg_path, 
-                    "-f", "lavfi", "-i", "color=c=black:s=640x360", 
-                    "-frames:v", "1", 
-                    "-c:v", encoder, 
-                    "-f", "null", "-"
-                ]
-                
-                result = subprocess.run(
+                process = subprocess.Popen(
                     cmd,
-                    capture_output=True,
-                    text=True,
-                    creationflags=subprocess.CREATE_NO_WINDOW,
-                    timeout=3
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    creationflags=subprocess.CREATE_NO_WINDOW
                 )
-                
-                if result.returncode == 0:
-                    print(f"Verified working {name} hardware encoder: {encoder}")
-                    return encoder
-                else:
-                    print(f"Hardware encoder {encoder} found but failed test (Driver update may be required)")
-                    
+                probes.append((encoder, name, process))
             except Exception as e:
                 print(f"Error testing encoder {encoder}: {e}")
         
+        deadline = time.monotonic() + 3
+        selected = None
+        for encoder, name, process in probes:
+            try:
+                returncode = process.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                process.kill()
+                print(f"Error testing encoder {encoder}: timed out")
+                continue
+            
+            if selected is not None:
+                continue
+            if returncode == 0:
+                print(f"Verified working {name} hardware encoder: {encoder}")
+                selected = encoder
+            else:
+                print(f"Hardware encoder {encoder} found but failed test (Driver update may be required)")
+        
+        if selected is not None:
+            return selected
+        
         print("Using CPU encoder: libx264 (Optimized for performance)")
         return "libx264"
     
-    def _build_ffmpeg_cmd(self, output_path: str, is_segment: bool = False,
-                          max_segments: int = None) -> list:
-        """Build FFmpeg command with appropriate audio settings.
+    def _list_encoders(self) -> set:
+        """List the encoder names compiled into FFmpeg.
+        
+        Returns:
+            Set of encoder names, or None if the list could not be read.
+        """
+        try:
+            result = subprocess.run(
+                [self.ffmpeg_path, "-hide_banner", "-encoders"],
+                capture_output=True,
+                text=True,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+                timeout=3
+            )
+            # Lines look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+            return {
+                parts[1] for parts in (line.split() for line in result.stdout.splitlines())
+                if len(parts) >= 2
+            }
+        except Exception as e:
+            print(f"Error listing encoders: {e}")
+            return None
+    
+    def _build_encoder_args(self, encoder: str, gpu_frames: bool = False) -> list:
+        """Build the video encoding arguments for the selected encoder.
         
         Args:
-            output_path: Output file or pattern path
-            is_segment: Whether to use segmented output
-            max_segments: Max segments for segment wrap (required if is_segment)
+            encoder: Encoder name from _detect_hw_encoder
+            gpu_frames: Input frames are D3D11 textures, so no pixel format
+                conversion is requested
             
         Returns:
-            FFmpeg command as list
+            FFmpeg video encoding arguments as list
         """
-        cmd = [self.ffmpeg_path]
-        
-        # Video input (screen capture at 60 fps)
-        cmd.extend(["-f", "gdigrab", "-framerate", "60", "-i", "desktop"])
+        # One keyframe per buffer segment so segment cuts land on GOP
+        # boundaries and the stream-copy concat joins cleanly
+        gop = str(self.segment_duration * self.FRAMERATE)
         
-        # Audio input if available
-        if self._audio_device:
-            cmd.extend(["-f", "dshow", "-i", f"audio={self._audio_device}"])
-        
-        # Video encoding - use hardware if available
-        encoder = self._hw_encoder
         if encoder == "h264_nvenc":
             # NVIDIA NVENC - very low CPU usage
-            cmd.extend([
+            args = [
                 "-c:v", "h264_nvenc",
                 "-preset", "p1",        # Fastest preset
                 "-tune", "ll",          # Low latency
                 "-rc", "vbr",           # Variable bitrate
                 "-cq", "23",            # Quality level
-                "-pix_fmt", "yuv420p"
-            ])
+                "-delay", "0",          # Don't buffer frames before output
+                "-zerolatency", "1",    # No reordering delay
+                "-g", gop,
+                "-forced-idr", "1",
+                "-bf", "0",             # No B-frames
+                "-no-scenecut", "1",    # Keyframes only at GOP boundaries
+            ]
+            if not gpu_frames:
+                args.extend(["-pix_fmt", "nv12"])  # NVENC's native input layout
+            return args
         elif encoder == "h264_amf":
             # AMD AMF
-            cmd.extend([
+            return [
                 "-c:v", "h264_amf",
                 "-quality", "speed",
                 "-rc", "vbr_latency",
                 "-qp_i", "23",
                 "-qp_p", "23",
-                "-pix_fmt", "yuv420p"
-            ])
+                "-g", gop,
+                "-pix_fmt", "nv12"      # AMF's native input layout
+            ]
         elif encoder == "h264_qsv":
             # Intel QuickSync
-            cmd.extend([
+            return [
                 "-c:v", "h264_qsv",
                 "-preset", "veryfast",
                 "-global_quality", "23",
+                "-g", gop,
                 "-pix_fmt", "nv12"
-            ])
+            ]
         else:
             # CPU fallback
-            cmd.extend([
+            return [
                 "-c:v", "libx264",
                 "-preset", "ultrafast",
                 "-crf", "23",
-                "-pix_fmt", "yuv420p"
-            ])
+                "-tune", "zerolatency",
+                "-g", gop,
+                "-keyint_min", gop,
+                "-sc_threshold", "0",   # Keyframes only at GOP boundaries
+                "-pix_fmt", "yuv420p",
+                "-sws_flags", "fast_bilinear"  # Cheapest BGRA -> YUV conversion
+            ]
+    
+    def _build_capture_cmd(self) -> tuple:
+        """Build the fixed part of the recording command (inputs and encoders).
+        
+        Returns:
+            FFmpeg command prefix as tuple
+        """
+        # Errors only: no banner or per-frame progress lines on stderr
+        cmd = [self.ffmpeg_path, "-hide_banner", "-loglevel", "error", "-nostats"]
+        
+        # Video input (screen capture at 60 fps)
+        cmd.extend(self._capture_input)
+        
+        # Audio input if available. A larger real-time buffer keeps dshow
+        # from dropping audio while the encoder is briefly busy.
+        if self._audio_device:
+            cmd.extend(["-f", "dshow", "-rtbufsize", "100M",
+                        "-i", f"audio={self._audio_device}"])
+        
+        # Video encoding - use hardware if available
+        cmd.extend(self._encoder_args)
         
         # Audio encoding if we have audio
         if self._audio_device:
             cmd.extend(["-c:a", "aac", "-b:a", "192k"])
         
-        # Segmentation options
+        return tuple(cmd)
+    
+    def _build_ffmpeg_cmd(self, output_path: str, is_segment: bool = False,
+                          max_segments: int = None) -> tuple:
+        """Build FFmpeg recording command for the given output.
+        
+        Args:
+            output_path: Output file or pattern path
+            is_segment: Whether to use segmented output
+            max_segments: Max segments for segment wrap and the segment list
+                (required if is_segment)
+            
+        Returns:
+            FFmpeg command as tuple
+        """
         if is_segment:
-            cmd.extend([
+            return self._capture_cmd + (
                 "-f", "segment",
                 "-segment_time", str(self.segment_duration),
                 "-segment_wrap", str(max_segments),
-                "-reset_timestamps", "1"
-            ])
-        
-        cmd.extend(["-y", output_path])
-        return cmd
+                "-segment_list", os.path.join(self.buffer_dir, self.SEGMENT_LIST_NAME),
+                "-segment_list_type", "csv",
+                # One short of the ring, so the list never names the file
+                # being overwritten, even if FFmpeg is killed mid-segment
+                "-segment_list_size", str(max_segments - 1),
+                # Cut on the keyframe even if it lands slightly early
+                "-segment_time_delta", "0.05",
+                "-reset_timestamps", "1",
+                "-avoid_negative_ts", "make_zero",
+                # Fragmented segments stay playable if FFmpeg is killed
+                "-segment_format_options", "movflags=+frag_keyframe+empty_moov",
+                "-y", output_path
+            )
+        return self._capture_cmd + ("-y", output_path)
     
     @property
     def output_dir(self) -> str:
@@ -229,10 +551,8 @@ class ScreenRecorder:
     
     @property
     def buffer_dir(self) -> str:
-        """Get buffer directory."""
-        buf_dir = os.path.join(self.settings.app_data_dir, ".buffer")
-        os.makedirs(buf_dir, exist_ok=True)
-        return buf_dir
+        """Get buffer directory (created once at startup)."""
+        return self._buffer_dir
     
     @property
     def buffer_duration_seconds(self) -> int:
@@ -246,31 +566,151 @@ class ScreenRecorder:
     def _cleanup_buffer(self):
         """Clean up old buffer files."""
         try:
-            for f in glob.glob(os.path.join(self.buffer_dir, "buffer_*.mp4")):
-                try:
-                    os.remove(f)
-                except:
-                    pass
-            for f in glob.glob(os.path.join(self.buffer_dir, "*.m3u8")):
-                try:
-                    os.remove(f)
-                except:
-                    pass
-            for f in glob.glob(os.path.join(self.buffer_dir, "*.ts")):
-                try:
-                    os.remove(f)
-                except:
-                    pass
+            # Single directory pass instead of one glob per extension
+            with os.scandir(self.buffer_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if ((name.startswith("buffer_") and name.endswith((".mp4", ".csv")))
+                            or name.endswith((".m3u8", ".ts"))):
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
         except Exception as e:
             print(f"Warning: Buffer cleanup error: {e}")
     
+    def _remove_stale_staging(self):
+        """Delete buffer staging directories of saves interrupted by a crash.
+        
+        Runs on the I/O worker before any save is queued, so none of them
+        can belong to a save in progress.
+        """
+        parent, name = os.path.split(self.buffer_dir)
+        try:
+            with os.scandir(parent) as it:
+                stale = [e.path for e in it if e.name.startswith(f"{name}_") and e.is_dir()]
+        except OSError as e:
+            print(f"Warning: Could not scan for stale buffer directories: {e}")
+            return
+        for path in stale:
+            shutil.rmtree(path, ignore_errors=True)
+    
+    def _list_buffer_segments(self, directory: str) -> list:
+        """Get the buffer segment paths in chronological order.
+        
+        FFmpeg's segment list already holds the finished segments in write
+        order, oldest first. If it is missing or empty (e.g. FFmpeg stopped
+        before finishing a segment), fall back to ordering the segment files
+        by modification time.
+        
+        Args:
+            directory: Directory holding the segments and segment list
+            
+        Returns:
+            List of segment file paths, oldest first
+        """
+        segment_list = os.path.join(directory, self.SEGMENT_LIST_NAME)
+        try:
+            with open(segment_list, newline="", encoding="utf-8") as f:
+                # Rows are: filename, start time, end time
+                names = [row[0] for row in csv.reader(f) if row]
+        except OSError:
+            names = []
+        
+        if names:
+            return [os.path.join(directory, name) for name in names]
+        
+        # Segment names wrap around, so order by write time. On Windows
+        # DirEntry.stat() is served from the directory listing itself.
+        with os.scandir(directory) as it:
+            timed = sorted(
+                (e.stat().st_mtime_ns, e.path) for e in it
+                if e.name.startswith("buffer_") and e.name.endswith(".mp4")
+            )
+        return [path for _, path in timed]
+    
+    def _spawn_ffmpeg(self, cmd) -> subprocess.Popen:
+        """Start a recording FFmpeg process.
+        
+        When this process has a console, FFmpeg shares it so it can be sent
+        CTRL_BREAK_EVENT; its own process group keeps the event (and Ctrl+C)
+        from reaching this process. Otherwise it gets a hidden console.
+        """
+        creationflags = subprocess.CREATE_NEW_PROCESS_GROUP
+        if not self._has_console:
+            creationflags |= subprocess.CREATE_NO_WINDOW
+        return subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=creationflags
+        )
+    
+    def _stop_ffmpeg(self, process: subprocess.Popen):
+        """Stop a recording FFmpeg process, letting it finalize the output.
+        
+        Sends 'q' on stdin, then falls back to CTRL_BREAK_EVENT when FFmpeg
+        shares this process's console. The process is only killed if neither
+        works, which can leave the last file unplayable. Blocks until FFmpeg
+        exits, so it runs on the I/O worker.
+        """
+        try:
+            process.stdin.write(b'q')
+            process.stdin.flush()
+            process.wait(timeout=5)
+            return
+        except Exception:
+            pass
+        
+        if self._has_console:
+            try:
+                os.kill(process.pid, signal.CTRL_BREAK_EVENT)
+                process.wait(timeout=3)
+                return
+            except Exception:
+                pass
+        
+        # Force kill if graceful stop fails
+        process.kill()
+        process.wait()
+    
+    def _detach_ffmpeg(self) -> subprocess.Popen:
+        """Take the running FFmpeg process out of the recorder and go idle.
+        
+        Returns:
+            The process, for the I/O worker to stop
+        """
+        process = self.ffmpeg_process
+        self.ffmpeg_process = None
+        self._ffmpeg_stopped.clear()
+        self._set_mode(None)
+        return process
+    
+    def _can_start(self) -> bool:
+        """Check that nothing is recording and the last FFmpeg has exited."""
+        if self.current_mode is not None:
+            return False
+        if not self._ffmpeg_stopped.is_set():
+            print("Warning: Previous recording is still stopping")
+            return False
+        return True
+    
+    def _register_video(self, output_file: str, mode: str):
+        """Add a finished recording to the database."""
+        if output_file and os.path.exists(output_file):
+            try:
+                self.db.add_video(output_file, mode)
+            except Exception as e:
+                print(f"Error adding to database: {e}")
+    
     def start_fulltime(self) -> bool:
         """Start fulltime recording mode.
         
         Returns:
             True if recording started successfully, False otherwise.
         """
-        if self.current_mode is not None:
+        if not self._can_start():
             return False
         
         self._cleanup_buffer()
@@ -287,50 +727,39 @@ class ScreenRecorder:
         cmd = self._build_ffmpeg_cmd(self.current_output_file)
         
         try:
-            self.ffmpeg_process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            self.current_mode = "fulltime"
+            self.ffmpeg_process = self._spawn_ffmpeg(cmd)
+            self._set_mode("fulltime")
             return True
         except Exception as e:
             print(f"Error starting fulltime recording: {e}")
             return False
     
-    def stop_fulltime(self) -> str:
+    def stop_fulltime(self) -> Future:
         """Stop fulltime recording.
         
+        Returns right away; FFmpeg is stopped and the recording registered
+        in the database in the background.
+        
         Returns:
-            Path to the recorded file, or None if not recording.
+            Future resolving to the path of the recorded file, or None if not
+            recording.
         """
         if self.current_mode != "fulltime" or self.ffmpeg_process is None:
             return None
         
         output_file = self.current_output_file
-        
-        try:
-            # Send 'q' to gracefully stop FFmpeg
-            self.ffmpeg_process.stdin.write(b'q')
-            self.ffmpeg_process.stdin.flush()
-            self.ffmpeg_process.wait(timeout=5)
-        except:
-            # Force kill if graceful stop fails
-            self.ffmpeg_process.kill()
-        
-        self.ffmpeg_process = None
-        self.current_mode = None
         self.current_output_file = None
+        process = self._detach_ffmpeg()
         
-        # Register to database
-        if output_file and os.path.exists(output_file):
-            try:
-                self.db.add_video(output_file, "fulltime")
-            except Exception as e:
-                print(f"Error adding to database: {e}")
-        
+        return self._io_pool.submit(self._finish_fulltime, process, output_file)
+    
+    def _finish_fulltime(self, process: subprocess.Popen, output_file: str) -> str:
+        """Stop FFmpeg and register the finished recording (runs on the I/O worker)."""
+        try:
+            self._stop_ffmpeg(process)
+        finally:
+            self._ffmpeg_stopped.set()
+        self._register_video(output_file, "fulltime")
         return output_file
     
     def start_buffer(self) -> bool:
@@ -339,7 +768,7 @@ class ScreenRecorder:
         Returns:
             True if recording started successfully, False otherwise.
         """
-        if self.current_mode is not None:
+        if not self._can_start():
             return False
         
         self._cleanup_buffer()
@@ -354,116 +783,222 @@ class ScreenRecorder:
         cmd = self._build_ffmpeg_cmd(segment_pattern, is_segment=True, max_segments=max_segments)
         
         try:
-            self.ffmpeg_process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            self.current_mode = "buffer"
-            self._buffer_start_time = time.time()
+            self.ffmpeg_process = self._spawn_ffmpeg(cmd)
+            self._set_mode("buffer")
+            self._buffer_start_time = time.monotonic()
             return True
         except Exception as e:
             print(f"Error starting buffer recording: {e}")
             return False
     
-    def save_buffer(self) -> str:
+    def save_buffer(self) -> Future:
         """Stop buffer recording and save the buffer to a file.
         
+        Returns right away; FFmpeg is stopped, the segments are joined into
+        the output file and it is registered in the background.
+        
         Returns:
-            Path to the saved buffer file, or None if not in buffer mode.
+            Future resolving to the path of the saved buffer file (None if
+            saving failed), or None if not in buffer mode.
         """
         if self.current_mode != "buffer" or self.ffmpeg_process is None:
             return None
         
-        # Stop the recording first
-        try:
-            self.ffmpeg_process.stdin.write(b'q')
-            self.ffmpeg_process.stdin.flush()
-            self.ffmpeg_process.wait(timeout=5)
-        except:
-            self.ffmpeg_process.kill()
+        timestamp = self._get_timestamp()
+        output_file = os.path.join(self.output_dir, f"replay_{timestamp}.mp4")
+        process = self._detach_ffmpeg()
         
-        self.ffmpeg_process = None
-        self.current_mode = None
+        return self._io_pool.submit(self._save_buffer, process, timestamp, output_file)
+    
+    def _save_buffer(self, process: subprocess.Popen, timestamp: str, output_file: str) -> str:
+        """Stop the buffer's FFmpeg and save its segments (runs on the I/O worker).
+        
+        The segments are moved aside to their own directory first, so a new
+        buffer can start while they are joined.
+        
+        Returns:
+            Path to the saved buffer file, or None if saving failed
+        """
+        staging_dir = f"{self.buffer_dir}_{timestamp}"
+        try:
+            self._stop_ffmpeg(process)
+            try:
+                os.rename(self.buffer_dir, staging_dir)
+                os.makedirs(self.buffer_dir, exist_ok=True)
+            except OSError as e:
+                print(f"Warning: Could not move buffer segments aside: {e}")
+                # Save in place before a new buffer can reuse the directory
+                return self._finish_buffer_save(self.buffer_dir, output_file)
+        finally:
+            self._ffmpeg_stopped.set()
         
-        # Find all buffer segments
-        segments = sorted(glob.glob(os.path.join(self.buffer_dir, "buffer_*.mp4")))
+        return self._finish_buffer_save(staging_dir, output_file)
+    
+    def _finish_buffer_save(self, segment_dir: str, output_file: str) -> str:
+        """Join the buffer segments into the output file and register it.
         
-        if not segments:
+        Args:
+            segment_dir: Directory holding the stopped buffer's segments
+            output_file: Path of the replay file to write
+            
+        Returns:
+            Path to the saved buffer file, or None if saving failed
+        """
+        try:
+            segments = self._list_buffer_segments(segment_dir)
+            if not segments:
+                return None
+            
+            # Ensure output directory exists
+            os.makedirs(self.output_dir, exist_ok=True)
+            
+            # A single segment is already a complete MP4 - just move it into place
+            moved = False
+            if len(segments) == 1:
+                try:
+                    os.replace(segments[0], output_file)
+                    moved = True
+                except OSError:
+                    pass  # e.g. output on another drive; remux below instead
+            
+            if not moved:
+                self._concat_segments(segments, output_file)
+        except Exception as e:
+            print(f"Error concatenating buffer: {e}")
             return None
+        finally:
+            # Cleanup
+            if segment_dir == self.buffer_dir:
+                self._cleanup_buffer()
+            else:
+                shutil.rmtree(segment_dir, ignore_errors=True)
         
-        # Ensure output directory exists
-        os.makedirs(self.output_dir, exist_ok=True)
+        # Register to database
+        self._register_video(output_file, "buffer")
         
-        # Create concat file
-        timestamp = self._get_timestamp()
-        concat_file = os.path.join(self.buffer_dir, "concat.txt")
-        output_file = os.path.join(self.output_dir, f"replay_{timestamp}.mp4")
+        return output_file
+    
+    def _concat_segments(self, segments: list, output_file: str):
+        """Join buffer segments into one file without re-encoding.
+        
+        Remuxes in-process with PyAV when available, otherwise runs the
+        FFmpeg concat demuxer.
+        """
+        if av is not None:
+            try:
+                self._concat_segments_av(segments, output_file)
+                return
+            except Exception as e:
+                print(f"Error concatenating buffer with PyAV: {e}")
         
-        # Sort segments by modification time to get correct order
-        segments.sort(key=lambda x: os.path.getmtime(x))
+        self._concat_segments_ffmpeg(segments, output_file)
+    
+    def _concat_segments_av(self, segments: list, output_file: str):
+        """Concatenate segments by copying their packets with PyAV.
         
-        with open(concat_file, 'w') as f:
+        Each segment's timestamps start at zero, so packets are shifted by
+        the end time of the previous segments on the same stream.
+        """
+        with av.open(output_file, "w", options={"movflags": "+faststart"}) as output:
+            out_streams = None
+            offsets = None
             for seg in segments:
-                # Use forward slashes for FFmpeg
-                f.write(f"file '{seg.replace(os.sep, '/')}'\n")
+                with av.open(seg) as container:
+                    if out_streams is None:
+                        out_streams = [self._add_stream_like(output, s) for s in container.streams]
+                        offsets = [0] * len(out_streams)
+                    ends = list(offsets)
+                    for packet in container.demux():
+                        if packet.dts is None:
+                            continue  # Flush packet at end of stream
+                        i = packet.stream.index
+                        packet.dts += offsets[i]
+                        if packet.pts is not None:
+                            packet.pts += offsets[i]
+                        ends[i] = max(ends[i], packet.dts + (packet.duration or 0))
+                        packet.stream = out_streams[i]
+                        output.mux(packet)
+                    offsets = ends
+    
+    @staticmethod
+    def _add_stream_like(output, stream):
+        """Add an output stream copying the codec parameters of an input stream."""
+        # PyAV 12+ has add_stream_from_template; older versions take template=
+        if hasattr(output, "add_stream_from_template"):
+            return output.add_stream_from_template(stream)
+        return output.add_stream(template=stream)
+    
+    def _concat_segments_ffmpeg(self, segments: list, output_file: str):
+        """Concatenate segments with the FFmpeg concat demuxer."""
+        # Concat list is fed to FFmpeg on stdin (forward slashes for FFmpeg)
+        manifest = "".join(
+            f"file '{seg.replace(os.sep, '/')}'\n" for seg in segments
+        ).encode("utf-8")
         
-        # Concat segments
         concat_cmd = [
-            "ffmpeg",
+            self.ffmpeg_path,
+            "-hide_banner", "-loglevel", "error", "-nostats",
             "-f", "concat",
             "-safe", "0",
-            "-i", concat_file,
+            "-protocol_whitelist", "pipe,file",
+            "-i", "pipe:0",
             "-c", "copy",
+            "-movflags", "+faststart",  # moov up front for instant seeking
             "-y",
             output_file
         ]
         
-        try:
-            subprocess.run(
+        with ffmpeg_slots:
+            proc = subprocess.Popen(
                 concat_cmd,
+                stdin=subprocess.PIPE,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-                timeout=60
+                creationflags=subprocess.CREATE_NO_WINDOW
             )
-        except Exception as e:
-            print(f"Error concatenating buffer: {e}")
-            return None
-        finally:
-            # Cleanup
-            self._cleanup_buffer()
             try:
-                os.remove(concat_file)
-            except:
-                pass
-        
-        # Register to database
-        if output_file and os.path.exists(output_file):
-            try:
-                self.db.add_video(output_file, "buffer")
-            except Exception as e:
-                print(f"Error adding to database: {e}")
-        
-        return output_file
+                proc.communicate(manifest, timeout=60)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                raise
     
     def cancel_buffer(self):
         """Cancel buffer recording without saving."""
         if self.current_mode != "buffer" or self.ffmpeg_process is None:
             return
         
+        process = self._detach_ffmpeg()
+        self._io_pool.submit(self._cancel_buffer, process)
+    
+    def _cancel_buffer(self, process: subprocess.Popen):
+        """Stop the buffer's FFmpeg and discard its segments (runs on the I/O worker)."""
         try:
-            self.ffmpeg_process.stdin.write(b'q')
-            self.ffmpeg_process.stdin.flush()
-            self.ffmpeg_process.wait(timeout=5)
-        except:
-            self.ffmpeg_process.kill()
+            self._stop_ffmpeg(process)
+            self._cleanup_buffer()
+        finally:
+            self._ffmpeg_stopped.set()
+    
+    def shutdown(self):
+        """Wait for background stops and saves to finish. Call before closing the database."""
+        self._io_pool.shutdown(wait=True)
+    
+    def add_mode_listener(self, callback):
+        """Register a callback invoked with the new mode whenever it changes.
         
-        self.ffmpeg_process = None
-        self.current_mode = None
-        self._cleanup_buffer()
+        The callback runs on whichever thread changed the mode.
+        """
+        self._mode_listeners.append(callback)
+    
+    def _set_mode(self, mode):
+        """Set the current recording mode and notify listeners."""
+        if mode == self.current_mode:
+            return
+        self.current_mode = mode
+        for callback in self._mode_listeners:
+            try:
+                callback(mode)
+            except Exception as e:
+                print(f"Error in mode listener: {e}")
     
     def is_recording(self) -> bool:
         """Check if currently recording."""
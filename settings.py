@@ -2,8 +2,11 @@
 Settings module - Manages application configuration.
 Stores settings in %APPDATA%/ScreenRecorder/config.json
 """
+import atexit
+import functools
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -14,14 +17,28 @@ class Settings:
     DEFAULT_SETTINGS = {
         "output_dir": str(Path.home() / "Videos" / "ScreenRecorder"),
         "buffer_duration_minutes": 5,  # 1-30 minutes
+        # Device detection results, reused while the fingerprint matches
+        "detection_fingerprint": None,
+        "cached_capture_source": None,
+        "cached_hw_encoder": None,
+        "cached_gpu_frames": None,
     }
     
+    # Delay before pending changes are written to disk
+    SAVE_DELAY_SECONDS = 0.5
+    
     def __init__(self):
         self.app_data_dir = os.path.join(os.environ.get("APPDATA", str(Path.home())), "ScreenRecorder")
         self.config_file = os.path.join(self.app_data_dir, "config.json")
         self.thumbnails_dir = os.path.join(self.app_data_dir, "thumbnails")
         self._settings = {}
         
+        # Writes are debounced: bursts of changes collapse into one save
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._save_timer = None
+        atexit.register(self.flush)
+        
         # Ensure directories exist
         os.makedirs(self.app_data_dir, exist_ok=True)
         os.makedirs(self.thumbnails_dir, exist_ok=True)
@@ -45,11 +62,39 @@ class Settings:
         # Ensure output directory exists
         os.makedirs(self._settings["output_dir"], exist_ok=True)
     
+    def _mark_dirty(self):
+        """Schedule a save, restarting the delay if one is already pending."""
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY_SECONDS, self._save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self):
+        """Write any pending changes now."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        self._save()
+    
     def _save(self):
-        """Save settings to file."""
+        """Save settings to file if there are unsaved changes."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = dict(self._settings)
+            self._dirty = False
+        
+        # Write a sibling temp file and swap it in so a crash can't leave a
+        # truncated config behind
+        tmp_file = self.config_file + ".tmp"
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self._settings, f, indent=2)
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_file, self.config_file)
         except IOError as e:
             print(f"Error saving settings: {e}")
     
@@ -59,8 +104,15 @@ class Settings:
     
     def set(self, key: str, value: Any):
         """Set a setting value and save."""
-        self._settings[key] = value
-        self._save()
+        with self._lock:
+            self._settings[key] = value
+        self._mark_dirty()
+    
+    def update(self, values: dict):
+        """Set several setting values and save once."""
+        with self._lock:
+            self._settings.update(values)
+        self._mark_dirty()
     
     @property
     def output_dir(self) -> str:
@@ -71,8 +123,9 @@ class Settings:
     def output_dir(self, path: str):
         """Set output directory."""
         os.makedirs(path, exist_ok=True)
-        self._settings["output_dir"] = path
-        self._save()
+        with self._lock:
+            self._settings["output_dir"] = path
+        self._mark_dirty()
     
     @property
     def buffer_duration_minutes(self) -> int:
@@ -82,8 +135,9 @@ class Settings:
     @buffer_duration_minutes.setter
     def buffer_duration_minutes(self, minutes: int):
         """Set buffer duration (clamped to 1-30)."""
-        self._settings["buffer_duration_minutes"] = max(1, min(30, minutes))
-        self._save()
+        with self._lock:
+            self._settings["buffer_duration_minutes"] = max(1, min(30, minutes))
+        self._mark_dirty()
     
     @property
     def buffer_duration_seconds(self) -> int:
@@ -92,11 +146,7 @@ class Settings:
 
 
 # Global settings instance
-_settings_instance = None
-
+@functools.cache
 def get_settings() -> Settings:
     """Get the global settings instance."""
-    global _settings_instance
-    if _settings_instance is None:
-        _settings_instance = Settings()
-    return _settings_instance
+    return Settings()
@@ -4,6 +4,7 @@ Supports minimizing to system tray.
 """
 import tkinter as tk
 from tkinter import ttk
+import functools
 import threading
 from PIL import Image, ImageDraw
 import pystray
@@ -11,16 +12,75 @@ from ui.videos_tab import VideosTab
 from ui.settings_tab import SettingsTab
 
 
+# Neutral dark colors (similar to VS Code/IDE dark themes)
+BG_DARK = "#1e1e1e"      # Main background
+BG_MEDIUM = "#252526"    # Cards/panels
+BG_LIGHT = "#2d2d2d"     # Hover/selected
+FG_LIGHT = "#cccccc"     # Primary text
+FG_DIM = "#808080"       # Secondary text
+ACCENT = "#3c3c3c"       # Buttons/tabs
+HIGHLIGHT = "#007acc"    # Selection highlight (blue accent)
+
+
+@functools.cache
+def _install_dark_theme(root):
+    """Configure ttk styles for the dark theme, once per Tk root.
+    
+    ttk styles live in the root's Tcl interpreter and are shared by every
+    widget under it.
+    """
+    style = ttk.Style(root)
+    style.theme_use("clam")
+    
+    style.configure(".", background=BG_DARK, foreground=FG_LIGHT)
+    style.configure("TFrame", background=BG_DARK)
+    style.configure("TLabel", background=BG_DARK, foreground=FG_LIGHT)
+    style.configure("TButton", background=ACCENT, foreground=FG_LIGHT)
+    style.map("TButton", background=[("active", BG_LIGHT)])
+    style.configure("TNotebook", background=BG_DARK)
+    style.configure("TNotebook.Tab", background=BG_MEDIUM, foreground=FG_LIGHT, padding=[15, 8])
+    style.map("TNotebook.Tab", background=[("selected", BG_DARK)])
+    style.configure("Card.TFrame", background=BG_MEDIUM)
+    style.configure("TLabelframe", background=BG_DARK, foreground=FG_LIGHT)
+    style.configure("TLabelframe.Label", background=BG_DARK, foreground=FG_LIGHT)
+    style.configure("TEntry", fieldbackground=BG_MEDIUM, foreground=FG_LIGHT)
+    style.configure("TSpinbox", fieldbackground=BG_MEDIUM, foreground=FG_LIGHT)
+    style.configure("Accent.TButton", background=HIGHLIGHT, foreground="white")
+    style.map("Accent.TButton", background=[("active", "#005a9e")])
+
+
+@functools.lru_cache(maxsize=1)
+def _tray_icon_image():
+    """Create the tray icon image (drawn once, then reused)."""
+    # Create a simple circle icon
+    size = 64
+    image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    
+    # Draw a red circle (recording indicator style)
+    draw.ellipse([4, 4, size-4, size-4], fill='#e94560', outline='#1a1a2e', width=2)
+    
+    return image
+
+
 class MainWindow:
     """Main application window with tabbed interface."""
     
+    # Status text and color per recorder mode
+    STATUS_DISPLAY = {
+        None: ("● IDLE", "#888888"),
+        "fulltime": ("● REC", "#ff4444"),
+        "buffer": ("● BUF", "#44aaff"),
+    }
+    
     def __init__(self, recorder, overlay, on_quit_callback=None):
         """Initialize the main window.
         
         Args:
             recorder: ScreenRecorder instance
             overlay: Overlay instance  
-            on_quit_callback: Callback when window is closed
+            on_quit_callback: Callback when window is closed; it must call
+                destroy() once it has finished
         """
         self.recorder = recorder
         self.overlay = overlay
@@ -31,9 +91,10 @@ class MainWindow:
         self.root.geometry("700x500")
         self.root.minsize(600, 400)
         
-        # System tray
+        # System tray icon, created once and only shown while minimized
         self.tray_icon = None
         self._tray_thread = None
+        self._start_tray()
         
         # Set dark theme
         self._setup_styles()
@@ -45,7 +106,14 @@ class MainWindow:
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.root.bind("<Unmap>", self._on_minimize)
         
-        # Update recording status periodically
+        # Thumbnails are generated in the background; refresh when one lands
+        self.recorder.db.add_thumbnail_listener(self._on_thumbnail_ready)
+        
+        # Update recording status whenever the recorder changes mode
+        self._last_mode = object()  # Sentinel so the first update always runs
+        self.recorder.add_mode_listener(
+            lambda mode: self.root.after_idle(self._update_status)
+        )
         self._update_status()
     
     def set_overlay(self, overlay):
@@ -56,18 +124,6 @@ class MainWindow:
         """
         self.overlay = overlay
     
-    def _create_tray_icon(self):
-        """Create a simple tray icon image."""
-        # Create a simple circle icon
-        size = 64
-        image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
-        
-        # Draw a red circle (recording indicator style)
-        draw.ellipse([4, 4, size-4, size-4], fill='#e94560', outline='#1a1a2e', width=2)
-        
-        return image
-    
     def _setup_tray(self):
         """Setup the system tray icon."""
         menu = pystray.Menu(
@@ -80,7 +136,7 @@ class MainWindow:
         
         self.tray_icon = pystray.Icon(
             "ScreenRecorder",
-            self._create_tray_icon(),
+            _tray_icon_image(),
             "Screen Recorder",
             menu
         )
@@ -95,10 +151,9 @@ class MainWindow:
         self.root.lift()
         self.root.focus_force()
         
-        # Stop tray icon
+        # Hide tray icon
         if self.tray_icon:
-            self.tray_icon.stop()
-            self.tray_icon = None
+            self.tray_icon.visible = False
     
     def _tray_toggle_fulltime(self, icon=None, item=None):
         """Toggle fulltime from tray."""
@@ -118,54 +173,32 @@ class MainWindow:
         """Handle window minimize - send to tray."""
         if self.root.state() == 'iconic':
             self.root.withdraw()  # Hide from taskbar
-            self._start_tray()
+            if self.tray_icon:
+                self.tray_icon.visible = True
     
     def _start_tray(self):
-        """Start the system tray icon."""
-        if self.tray_icon is None:
-            self._setup_tray()
-            self._tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
-            self._tray_thread.start()
+        """Start the system tray icon loop, hidden until the window is minimized."""
+        self._setup_tray()
+        # With a setup callback pystray leaves the icon hidden
+        self._tray_thread = threading.Thread(
+            target=self.tray_icon.run,
+            kwargs={"setup": lambda icon: None},
+            daemon=True
+        )
+        self._tray_thread.start()
     
     def _setup_styles(self):
         """Configure ttk styles for dark theme."""
-        style = ttk.Style()
-        style.theme_use("clam")
-        
-        # Neutral dark colors (similar to VS Code/IDE dark themes)
-        bg_dark = "#1e1e1e"      # Main background
-        bg_medium = "#252526"    # Cards/panels
-        bg_light = "#2d2d2d"     # Hover/selected
-        fg_light = "#cccccc"     # Primary text
-        fg_dim = "#808080"       # Secondary text
-        accent = "#3c3c3c"       # Buttons/tabs
-        highlight = "#007acc"    # Selection highlight (blue accent)
-        
-        style.configure(".", background=bg_dark, foreground=fg_light)
-        style.configure("TFrame", background=bg_dark)
-        style.configure("TLabel", background=bg_dark, foreground=fg_light)
-        style.configure("TButton", background=accent, foreground=fg_light)
-        style.map("TButton", background=[("active", bg_light)])
-        style.configure("TNotebook", background=bg_dark)
-        style.configure("TNotebook.Tab", background=bg_medium, foreground=fg_light, padding=[15, 8])
-        style.map("TNotebook.Tab", background=[("selected", bg_dark)])
-        style.configure("Card.TFrame", background=bg_medium)
-        style.configure("TLabelframe", background=bg_dark, foreground=fg_light)
-        style.configure("TLabelframe.Label", background=bg_dark, foreground=fg_light)
-        style.configure("TEntry", fieldbackground=bg_medium, foreground=fg_light)
-        style.configure("TSpinbox", fieldbackground=bg_medium, foreground=fg_light)
-        style.configure("Accent.TButton", background=highlight, foreground="white")
-        style.map("Accent.TButton", background=[("active", "#005a9e")])
-        
-        self.root.configure(bg=bg_dark)
+        _install_dark_theme(self.root)
+        self.root.configure(bg=BG_DARK)
         
         # Store colors for use in other widgets
         self.colors = {
-            "bg_dark": bg_dark,
-            "bg_medium": bg_medium,
-            "bg_light": bg_light,
-            "fg_light": fg_light,
-            "highlight": highlight
+            "bg_dark": BG_DARK,
+            "bg_medium": BG_MEDIUM,
+            "bg_light": BG_LIGHT,
+            "fg_light": FG_LIGHT,
+            "highlight": HIGHLIGHT
         }
     
     def _create_widgets(self):
@@ -175,11 +208,13 @@ class MainWindow:
         controls_frame.pack(fill="x", padx=15, pady=15)
         
         # Status indicator
+        status_text, status_color = self.STATUS_DISPLAY[None]
+        self.status_var = tk.StringVar(value=status_text)
         self.status_label = ttk.Label(
             controls_frame,
-            text="● IDLE",
+            textvariable=self.status_var,
             font=("Segoe UI", 14, "bold"),
-            foreground="#888888"
+            foreground=status_color
         )
         self.status_label.pack(side="left")
         
@@ -187,17 +222,19 @@ class MainWindow:
         btn_frame = ttk.Frame(controls_frame)
         btn_frame.pack(side="right")
         
+        self.fulltime_text = tk.StringVar(value="🔴 Fulltime (F9)")
         self.fulltime_btn = ttk.Button(
             btn_frame,
-            text="🔴 Fulltime (F9)",
+            textvariable=self.fulltime_text,
             command=self._toggle_fulltime,
             width=18
         )
         self.fulltime_btn.pack(side="left", padx=5)
         
+        self.buffer_text = tk.StringVar(value="🔵 Buffer (F10)")
         self.buffer_btn = ttk.Button(
             btn_frame,
-            text="🔵 Buffer (F10)",
+            textvariable=self.buffer_text,
             command=self._toggle_buffer,
             width=18
         )
@@ -211,18 +248,28 @@ class MainWindow:
         self.videos_tab = VideosTab(self.notebook)
         self.notebook.add(self.videos_tab, text="📹 Videos")
         
-        # Settings tab
-        self.settings_tab = SettingsTab(self.notebook)
-        self.notebook.add(self.settings_tab, text="⚙️ Settings")
+        # Settings tab, built the first time it is shown
+        self.settings_tab = None
+        self._settings_page = ttk.Frame(self.notebook)
+        self.notebook.add(self._settings_page, text="⚙️ Settings")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+    
+    def _on_tab_changed(self, event=None):
+        """Build the settings tab on first view."""
+        if self.settings_tab is not None:
+            return
+        if self.notebook.select() == str(self._settings_page):
+            self.settings_tab = SettingsTab(self._settings_page)
+            self.settings_tab.pack(fill="both", expand=True)
     
     def _toggle_fulltime(self):
         """Toggle fulltime recording from UI button."""
         if self.recorder.get_mode() == "fulltime":
-            output = self.recorder.stop_fulltime()
+            future = self.recorder.stop_fulltime()
             self.overlay.update_status("idle", False)
-            if output:
-                # Refresh videos list
-                self.videos_tab.refresh()
+            if future:
+                # Refresh videos list once the recording is registered
+                future.add_done_callback(self._on_recording_saved)
         elif self.recorder.get_mode() is None:
             if self.recorder.start_fulltime():
                 self.overlay.update_status("fulltime", True)
@@ -230,10 +277,10 @@ class MainWindow:
     def _toggle_buffer(self):
         """Toggle buffer recording from UI button."""
         if self.recorder.get_mode() == "buffer":
-            output = self.recorder.save_buffer()
+            future = self.recorder.save_buffer()
             self.overlay.update_status("idle", False)
-            if output:
-                self.videos_tab.refresh()
+            if future:
+                future.add_done_callback(self._on_recording_saved)
         elif self.recorder.get_mode() is None:
             if self.recorder.start_buffer():
                 self.overlay.update_status("buffer", True)
@@ -242,21 +289,32 @@ class MainWindow:
         """Update the status display."""
         mode = self.recorder.get_mode()
         
+        # Skip the widget updates when the mode hasn't changed
+        if mode == self._last_mode:
+            return
+        self._last_mode = mode
+        
+        status_text, status_color = self.STATUS_DISPLAY.get(mode, self.STATUS_DISPLAY[None])
+        self.status_var.set(status_text)
+        self.status_label.config(foreground=status_color)
+        
         if mode == "fulltime":
-            self.status_label.config(text="● REC", foreground="#ff4444")
-            self.fulltime_btn.config(text="⏹️ Stop (F9)")
+            self._set_text(self.fulltime_text, "⏹️ Stop (F9)")
             self.buffer_btn.config(state="disabled")
         elif mode == "buffer":
-            self.status_label.config(text="● BUF", foreground="#44aaff")
-            self.buffer_btn.config(text="💾 Save (F10)")
+            self._set_text(self.buffer_text, "💾 Save (F10)")
             self.fulltime_btn.config(state="disabled")
         else:
-            self.status_label.config(text="● IDLE", foreground="#888888")
-            self.fulltime_btn.config(text="🔴 Fulltime (F9)", state="normal")
-            self.buffer_btn.config(text="🔵 Buffer (F10)", state="normal")
-        
-        # Schedule next update
-        self.root.after(500, self._update_status)
+            self._set_text(self.fulltime_text, "🔴 Fulltime (F9)")
+            self._set_text(self.buffer_text, "🔵 Buffer (F10)")
+            self.fulltime_btn.config(state="normal")
+            self.buffer_btn.config(state="normal")
+    
+    @staticmethod
+    def _set_text(var, text):
+        """Set a button label, skipping the re-measure when it is unchanged."""
+        if var.get() != text:
+            var.set(text)
     
     def _on_close(self):
         """Handle window close."""
@@ -265,9 +323,29 @@ class MainWindow:
             self.tray_icon.stop()
         
         if self.on_quit_callback:
+            # The app destroys the window once its background work is done
+            self.root.withdraw()
             self.on_quit_callback()
+        else:
+            self.root.destroy()
+    
+    def close(self):
+        """Close the window and quit, as if the user closed it."""
+        self._on_close()
+    
+    def destroy(self):
+        """Destroy the window, ending the main loop."""
         self.root.destroy()
     
+    def _on_thumbnail_ready(self, video_id, thumbnail_path):
+        """Handle a finished thumbnail (called from a worker thread)."""
+        self.root.after(0, self.refresh_videos)
+    
+    def _on_recording_saved(self, future):
+        """Handle a finished save (called from the recorder's worker thread)."""
+        if future.result():
+            self.root.after(0, self.refresh_videos)
+    
     def refresh_videos(self):
         """Refresh the videos tab."""
         self.videos_tab.refresh()
@@ -1,6 +1,8 @@
 """
 Settings Tab - Configure app settings.
 """
+import threading
+import tkinter as tk
 from tkinter import ttk, filedialog
 from settings import get_settings
 
@@ -11,6 +13,10 @@ class SettingsTab(ttk.Frame):
     def __init__(self, parent):
         super().__init__(parent)
         self.settings = get_settings()
+        self.dir_var = tk.StringVar(self)
+        self.duration_var = tk.StringVar(self)
+        self._duration_after_id = None  # Pending debounced duration apply
+        self._status_after_id = None  # Pending hide of the save result
         self._create_widgets()
         self._load_settings()
     
@@ -24,7 +30,7 @@ class SettingsTab(ttk.Frame):
         dir_frame = ttk.LabelFrame(container, text="Output Directory", padding=10)
         dir_frame.pack(fill="x", pady=(0, 15))
         
-        self.dir_entry = ttk.Entry(dir_frame, width=50)
+        self.dir_entry = ttk.Entry(dir_frame, textvariable=self.dir_var, width=50)
         self.dir_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ttk.Button(dir_frame, text="📁 Browse", command=self._browse_directory).pack(side="left")
@@ -39,7 +45,8 @@ class SettingsTab(ttk.Frame):
             buffer_frame,
             from_=1,
             to=30,
-            width=5
+            width=5,
+            textvariable=self.duration_var
         )
         self.duration_spin.pack(side="left", padx=10)
         
@@ -68,38 +75,70 @@ Ctrl+Shift+Q - Quit application"""
     
     def _load_settings(self):
         """Load current settings into UI."""
-        # Clear and insert for Entry
-        self.dir_entry.delete(0, "end")
-        self.dir_entry.insert(0, self.settings.output_dir)
+        self.dir_var.set(self.settings.output_dir)
+        self.duration_var.set(str(self.settings.buffer_duration_minutes))
         
-        # Set spinbox value
-        self.duration_spin.delete(0, "end")
-        self.duration_spin.insert(0, str(self.settings.buffer_duration_minutes))
+        # Apply duration edits as they are made (the path waits for Save,
+        # so partially typed paths don't get created as folders)
+        self.duration_var.trace_add("write", self._on_duration_change)
+    
+    def _on_duration_change(self, *args):
+        """Apply the buffer duration shortly after the last edit."""
+        if self._duration_after_id is not None:
+            self.after_cancel(self._duration_after_id)
+        self._duration_after_id = self.after(300, self._apply_duration)
+    
+    def _apply_duration(self):
+        """Store the buffer duration; the settings file is written in the background."""
+        self._duration_after_id = None
+        try:
+            self.settings.buffer_duration_minutes = int(self.duration_var.get())
+        except ValueError:
+            pass  # Blank or partial input
     
     def _browse_directory(self):
         """Open directory browser."""
-        current_dir = self.dir_entry.get() or self.settings.output_dir
+        current_dir = self.dir_var.get() or self.settings.output_dir
         directory = filedialog.askdirectory(
             initialdir=current_dir,
             title="Select Output Directory"
         )
         if directory:
-            self.dir_entry.delete(0, "end")
-            self.dir_entry.insert(0, directory)
+            self.dir_var.set(directory)
     
     def _save_settings(self):
         """Save current settings."""
-        # Validate and save output directory
-        new_dir = self.dir_entry.get()
-        if new_dir:
-            self.settings.output_dir = new_dir
+        # Save buffer duration now rather than after the debounce
+        if self._duration_after_id is not None:
+            self.after_cancel(self._duration_after_id)
+        self._apply_duration()
         
-        # Save buffer duration
+        # Creating the output directory can block (e.g. network drives); the
+        # worker reports back once it is done
+        new_dir = self.dir_var.get()
+        if new_dir:
+            threading.Thread(target=self._apply_output_dir, args=(new_dir,), daemon=True).start()
+        else:
+            self._show_status("✓ Settings saved!")
+    
+    def _apply_output_dir(self, path: str):
+        """Create and store the output directory (runs on a worker thread)."""
         try:
-            duration = int(self.duration_spin.get())
-            self.settings.buffer_duration_minutes = duration
-        except ValueError:
-            pass
-        
-        self.status_label.config(text="✓ Settings saved!")
-        self.after(2000, lambda: self.status_label.config(text=""))
+            self.settings.output_dir = path
+        except (OSError, ValueError) as e:  # e.g. no permission, invalid path
+            print(f"Error setting output directory: {e}")
+            self.after(0, self._show_status, f"✗ Could not use output directory: {e}", "red")
+        else:
+            self.after(0, self._show_status, "✓ Settings saved!")
+    
+    def _show_status(self, text: str, color: str = "green"):
+        """Show the result of a save for a couple of seconds."""
+        if self._status_after_id is not None:
+            self.after_cancel(self._status_after_id)
+        self.status_label.config(text=text, foreground=color)
+        self._status_after_id = self.after(2000, self._clear_status)
+    
+    def _clear_status(self):
+        """Hide the save result."""
+        self._status_after_id = None
+        self.status_label.config(text="")
@@ -2,10 +2,12 @@
 Videos Tab - Displays recorded videos with thumbnails.
 """
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, font as tkfont
 import os
-from PIL import Image, ImageTk
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageDraw, ImageTk
 from database import get_database
+from settings import get_settings
 
 
 # Theme colors (matching main_window neutral dark theme)
@@ -16,20 +18,91 @@ FG_LIGHT = "#cccccc"
 FG_DIM = "#808080"
 HIGHLIGHT = "#007acc"
 
+THUMB_SIZE = (160, 90)
+
+# Bind tag shared by the clickable widgets of every video card
+CARD_BINDTAG = "VideoCard"
+
+# Every row of the virtualized list has the same height: a measured card
+# (which scales with the fonts, and so with DPI) plus this gap below it
+CARD_GAP = 4
+CARD_PADX = 5
+
+# Rows bound above and below the viewport so scrolling never shows a gap
+# before the next card is bound
+OVERSCAN_ROWS = 1
+
+# Rows above and below the viewport whose thumbnails are decoded ahead of
+# time, so short scrolls find them ready
+PREFETCH_ROWS = 8
+
+# Rows are fetched from the database in pages as they scroll into view
+PAGE_SIZE = 64
+
+# Delay before cards are refitted to a resized canvas; a window drag fires
+# <Configure> far more often than that
+RESIZE_DEBOUNCE_MS = 40
+
+
+class _Card:
+    """A pooled card: its widgets, its canvas window and the row it shows."""
+    
+    __slots__ = ("outer", "window", "thumb_label", "name_label", "mode_label",
+                 "meta_label", "video", "index")
+    
+    def __init__(self, outer, window, thumb_label, name_label, mode_label, meta_label):
+        self.outer = outer
+        self.window = window
+        self.thumb_label = thumb_label
+        self.name_label = name_label
+        self.mode_label = mode_label
+        self.meta_label = meta_label
+        self.video = None  # Row tuple the card shows
+        self.index = None  # Row index, None while hidden
+
 
 class VideosTab(ttk.Frame):
-    """Tab for viewing and managing recorded videos."""
+    """Tab for viewing and managing recorded videos.
+    
+    The list is virtualized: a small pool of card widgets is bound to
+    whichever rows are inside the viewport, so the widget count stays
+    constant however many recordings there are.
+    """
     
     def __init__(self, parent):
         super().__init__(parent)
-        self.thumbnails = {}  # Keep references to prevent garbage collection
-        self.video_frames = {}  # Map video_id to frame
-        self.videos_data = []  # Store video tuples
+        self.thumbnails = {}  # Map video_id to PhotoImage, only for rows in view
+        self._thumb_images = {}  # Map video_id to (thumbnail_path, PIL image or None)
+        self.videos_data = []  # Video tuples of the rows loaded so far
+        self._row_texts = []  # (mode text, metadata text) of each loaded row
+        self._row_count = 0  # Rows in the table, loaded or not
+        self._card_pool = []  # Reusable cards; row i is shown by card i % len(pool)
+        self._row_height = None  # Measured once the first card exists
+        self._last_signature = None  # Table signature the list was built from
+        self._empty_label = None
+        self._resize_after = None  # Pending card width update
+        self.selected_id = None
+        self._deleting = set()  # Ids of videos whose delete is in progress
+        
+        # Thumbnails are decoded off the UI thread; PIL releases the GIL
+        self._thumb_pool = ThreadPoolExecutor(max_workers=4)
+        self._thumb_futures = {}  # Map video_id to (thumbnail_path, pending decode)
+        
+        # Deletes remove files, which can be slow on some drives
+        self._delete_pool = ThreadPoolExecutor(max_workers=1)
         self._create_widgets()
         self.refresh()
     
     def _create_widgets(self):
         """Create the video list UI."""
+        # Named fonts shared by every card, so Tk resolves each font once
+        self._font_title = tkfont.Font(self, family="Segoe UI", size=11, weight="bold")
+        self._font_body = tkfont.Font(self, family="Segoe UI", size=11)
+        self._font_small = tkfont.Font(self, family="Segoe UI", size=9)
+        
+        # One placeholder image shared by every card without a thumbnail
+        self._no_preview = ImageTk.PhotoImage(self._render_no_preview())
+        
         # Toolbar
         toolbar = ttk.Frame(self)
         toolbar.pack(fill="x", padx=10, pady=5)
@@ -42,85 +115,240 @@ class VideosTab(ttk.Frame):
         container = ttk.Frame(self)
         container.pack(fill="both", expand=True, padx=10, pady=5)
         
-        # Canvas for scrolling
+        # Canvas for scrolling; cards are canvas windows at fixed row offsets
         self.canvas = tk.Canvas(container, bg=BG_DARK, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(container, orient="vertical", command=self.canvas.yview)
+        self.scrollbar = ttk.Scrollbar(container, orient="vertical", command=self.canvas.yview)
         
-        # Inner frame for video cards
-        self.inner_frame = tk.Frame(self.canvas, bg=BG_DARK)
+        # Rows are spaced by the real card height, before any row is shown
+        self._row_height = self._measure_row_height()
         
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        # Every view change (scroll, resize, new scrollregion) re-binds the
+        # cards to the rows now in view
+        self.canvas.configure(yscrollcommand=self._on_yview)
         
-        scrollbar.pack(side="right", fill="y")
+        self.scrollbar.pack(side="right", fill="y")
         self.canvas.pack(side="left", fill="both", expand=True)
         
-        # Create window in canvas
-        self.canvas_window_id = self.canvas.create_window(0, 0, window=self.inner_frame, anchor="nw")
+        # Card clicks are handled once for all cards through their bind tag
+        self.bind_class(CARD_BINDTAG, "<Button-1>", self._on_card_click)
+        self.bind_class(CARD_BINDTAG, "<Double-Button-1>", self._on_card_double_click)
         
         # Bind events
-        self.inner_frame.bind("<Configure>", self._on_frame_configure)
         self.canvas.bind("<Configure>", self._on_canvas_configure)
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
         
-        self.selected_id = None
+        # Only take the global wheel binding while the pointer is over the list
+        self.canvas.bind("<Enter>", self._bind_mousewheel)
+        self.canvas.bind("<Leave>", self._on_canvas_leave)
+        # Switching notebook tabs unmaps only the tab's own frame, not the canvas
+        self.bind("<Unmap>", self._unbind_mousewheel)
     
-    def _on_frame_configure(self, event):
-        """Update scroll region when inner frame changes."""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    def _on_yview(self, first, last):
+        """Update the scrollbar and show the rows now in view."""
+        self.scrollbar.set(first, last)
+        self._render_visible()
     
     def _on_canvas_configure(self, event):
-        """Update inner frame width when canvas resizes."""
-        self.canvas.itemconfig(self.canvas_window_id, width=event.width)
+        """Fill the resized canvas and refit the cards once resizing settles."""
+        if self._resize_after is not None:
+            self.after_cancel(self._resize_after)
+        self._resize_after = self.after(RESIZE_DEBOUNCE_MS, self._apply_card_width)
+        self._update_scrollregion()
+        self._render_visible()
+    
+    def _apply_card_width(self):
+        """Fit the cards to the current canvas width."""
+        self._resize_after = None
+        width = self._card_width()
+        for card in self._card_pool:
+            self.canvas.itemconfigure(card.window, width=width)
+    
+    def _card_width(self) -> int:
+        """Width of a card window for the current canvas width."""
+        return max(1, self.canvas.winfo_width() - 2 * CARD_PADX)
+    
+    def _update_scrollregion(self):
+        """Size the scroll region for all rows, whether or not they are loaded."""
+        height = self._row_count * self._row_height
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), height))
+    
+    def _bind_mousewheel(self, event=None):
+        """Scroll the list with the mouse wheel."""
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+    
+    def _on_canvas_leave(self, event):
+        """Drop the wheel binding once the pointer leaves the list."""
+        # Moving onto a card also leaves the canvas itself; keep it then
+        pointed = self.winfo_containing(*self.winfo_pointerxy())
+        if pointed is not None and str(pointed).startswith(str(self.canvas)):
+            return
+        self._unbind_mousewheel()
+    
+    def _unbind_mousewheel(self, event=None):
+        """Stop handling mouse wheel events."""
+        self.canvas.unbind_all("<MouseWheel>")
     
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling."""
         self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
     
     def refresh(self):
-        """Refresh the video list from database."""
-        # Clear existing
-        for widget in self.inner_frame.winfo_children():
-            widget.destroy()
-        self.video_frames.clear()
-        self.thumbnails.clear()
-        self.selected_id = None
+        """Refresh the video list from database.
         
+        Only the rows up to the current scroll position are fetched, and only
+        the cards for rows in view are re-bound; cards whose row didn't change
+        keep their widgets untouched.
+        """
         db = get_database()
-        self.videos_data = db.get_videos() or []
-        
-        if not self.videos_data:
-            empty_label = tk.Label(
-                self.inner_frame,
-                text="No recordings yet.\n\nPress F9 for fulltime recording\nPress F10 for buffer mode",
-                font=("Segoe UI", 11),
-                bg=BG_DARK, fg=FG_DIM,
-                justify="center"
-            )
-            empty_label.pack(pady=50, padx=20)
+        
+        # Nothing was added, deleted or given a thumbnail since the last refresh
+        signature = db.get_videos_signature()
+        if signature == self._last_signature:
             return
+        self._last_signature = signature
+        self._row_count = signature[0]
+        
+        # Later rows are loaded a page at a time as they scroll into view
+        self.videos_data = []
+        self._row_texts = []
+        self._load_rows(self._visible_range()[1])
+        current_ids = {video[0] for video in self.videos_data}
         
-        for video in self.videos_data:
-            self._create_video_card(video)
+        # Forget thumbnails and pending loads of deleted or unloaded videos
+        for video_id in [vid for vid in self._thumb_images if vid not in current_ids]:
+            del self._thumb_images[video_id]
+        for video_id in [vid for vid in self._thumb_futures if vid not in current_ids]:
+            self._thumb_futures.pop(video_id)[1].cancel()
+        if self.selected_id not in current_ids:
+            self.selected_id = None
+        
+        self._update_empty_label()
+        self._update_scrollregion()
+        self._render_visible()
+    
+    def _update_empty_label(self):
+        """Show the no-recordings hint only while the list is empty."""
+        if not self._row_count:
+            if self._empty_label is None:
+                self._empty_label = tk.Label(
+                    self.canvas,
+                    text="No recordings yet.\n\nPress F9 for fulltime recording\nPress F10 for buffer mode",
+                    font=self._font_body,
+                    bg=BG_DARK, fg=FG_DIM,
+                    justify="center"
+                )
+                self._empty_label.place(relx=0.5, y=50, anchor="n")
+        elif self._empty_label is not None:
+            self._empty_label.destroy()
+            self._empty_label = None
     
-    def _create_video_card(self, video):
-        """Create a card for a single video."""
-        video_id, filename, filepath, mode, duration, size, thumbnail_path, created_at = video
+    def _render_visible(self):
+        """Bind pooled cards to the rows inside the viewport and hide the rest."""
+        first, last = self._visible_range()
+        self._load_rows(last)
         
+        # Rows deleted since the last refresh may leave fewer than counted
+        last = min(last, len(self.videos_data))
+        first = min(first, last)
+        
+        # Grow the pool to cover the viewport; it never shrinks
+        while len(self._card_pool) < last - first:
+            self._card_pool.append(self._create_card())
+        
+        # Row i goes to card i % size, so scrolling by one row re-binds one card
+        size = len(self._card_pool)
+        for slot, card in enumerate(self._card_pool):
+            index = first + (slot - first) % size
+            if index < last:
+                self._show_row(card, index)
+            else:
+                self._hide_card(card)
+        
+        # Queue decodes for the rows around the view after those in it, and
+        # don't decode thumbnails for rows that were scrolled far past
+        self._load_rows(last + PREFETCH_ROWS)
+        nearby = self.videos_data[max(0, first - PREFETCH_ROWS):last + PREFETCH_ROWS]
+        for video_id, filename, _, _, _, _, thumbnail_path, _ in nearby:
+            cached = self._thumb_images.get(video_id)
+            if cached is None or cached[0] != thumbnail_path:
+                self._load_thumbnail(video_id, filename, thumbnail_path)
+        nearby_ids = {video[0] for video in nearby}
+        for video_id, (_, future) in list(self._thumb_futures.items()):
+            if video_id not in nearby_ids and future.cancel():
+                del self._thumb_futures[video_id]
+        
+        # Free the image memory in Tk of rows out of view; the decoded PIL
+        # images stay cached
+        visible_ids = {video[0] for video in self.videos_data[first:last]}
+        for video_id in [vid for vid in self.thumbnails if vid not in visible_ids]:
+            del self.thumbnails[video_id]
+    
+    def _visible_range(self):
+        """Get the (first, last) range of rows in view, including overscan."""
+        total = self._row_count
+        top = max(0, int(self.canvas.canvasy(0)))
+        first = min(total, max(0, top // self._row_height - OVERSCAN_ROWS))
+        last = min(total, (top + self.canvas.winfo_height()) // self._row_height + 1 + OVERSCAN_ROWS)
+        return first, last
+    
+    def _load_rows(self, count):
+        """Fetch whole pages of rows until at least count rows are loaded."""
+        loaded = len(self.videos_data)
+        if min(count, self._row_count) > loaded:
+            pages = -(-(count - loaded) // PAGE_SIZE)
+            rows = get_database().get_videos(pages * PAGE_SIZE, loaded)
+            self.videos_data += rows
+            self._row_texts += [self._format_row(video) for video in rows]
+    
+    @staticmethod
+    def _format_row(video):
+        """Format a row's label texts once, when it is loaded.
+        
+        Returns:
+            Tuple of (mode text, metadata text)
+        """
+        mode, size, created_at = video[3], video[5], video[7]
+        mode_text = "🔴 Fulltime" if mode == "fulltime" else "🔵 Buffer"
+        size_mb = size / (1024 * 1024) if size else 0
+        date_str = created_at[:16] if created_at else "Unknown"
+        return mode_text, f"{size_mb:.1f} MB  •  {date_str}"
+    
+    def _measure_row_height(self) -> int:
+        """Create the first pooled card and measure the row height from it.
+        
+        Cards take their requested height, which follows the font metrics,
+        so text isn't clipped at high DPI scaling.
+        
+        Returns:
+            Height of a row in pixels, including the gap below the card
+        """
+        card = self._create_card()
+        self._card_pool.append(card)
+        
+        # Measure with text like a bound row's; binding replaces it
+        card.name_label.configure(text="recording.mp4")
+        card.mode_label.configure(text="🔴 Fulltime")
+        card.meta_label.configure(text="0.0 MB  •  Unknown")
+        card.outer.update_idletasks()
+        return card.outer.winfo_reqheight() + CARD_GAP
+    
+    def _create_card(self):
+        """Create an unbound, hidden card widget for the pool.
+        
+        Returns:
+            The new card
+        """
         # Outer container (for selection border)
-        outer = tk.Frame(self.inner_frame, bg=BG_DARK, padx=3, pady=3)
-        outer.pack(fill="x", padx=5, pady=2)
-        outer.video_id = video_id
-        outer.filepath = filepath
-        self.video_frames[video_id] = outer
+        outer = tk.Frame(self.canvas, bg=BG_DARK, padx=3, pady=3)
+        outer.video_id = None
+        outer.filepath = None
         
         # Card background
         card = tk.Frame(outer, bg=BG_MEDIUM, padx=10, pady=8)
-        card.pack(fill="x")
+        card.pack(fill="both", expand=True)
         
-        # Bind click events to all widgets
+        # Route clicks on the card's widgets to the shared handlers
         def bind_clicks(widget):
-            widget.bind("<Button-1>", lambda e: self._select_video(video_id))
-            widget.bind("<Double-Button-1>", lambda e: self._play_video(filepath))
+            widget.bindtags((widget.bindtags()[0], CARD_BINDTAG) + widget.bindtags()[1:])
         
         bind_clicks(outer)
         bind_clicks(card)
@@ -134,57 +362,210 @@ class VideosTab(ttk.Frame):
         thumb_label.pack(fill="both", expand=True)
         bind_clicks(thumb_label)
         
-        # Load thumbnail
-        if thumbnail_path and os.path.exists(thumbnail_path):
-            try:
-                img = Image.open(thumbnail_path)
-                # Don't resize if already correct size
-                if img.size != (160, 90):
-                    img = img.resize((160, 90), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                self.thumbnails[video_id] = photo
-                thumb_label.configure(image=photo)
-            except Exception as e:
-                print(f"Thumbnail error for {filename}: {e}")
-                thumb_label.configure(text="No Preview")
-        else:
-            thumb_label.configure(text="No Preview")
-        
         # Right side: Info
         info = tk.Frame(card, bg=BG_MEDIUM)
         info.pack(side="left", fill="both", expand=True)
         bind_clicks(info)
         
         # Filename
-        name_label = tk.Label(info, text=filename, font=("Segoe UI", 11, "bold"),
+        name_label = tk.Label(info, font=self._font_title,
                               bg=BG_MEDIUM, fg=FG_LIGHT, anchor="w")
         name_label.pack(anchor="w", fill="x")
         bind_clicks(name_label)
         
         # Mode
-        mode_text = "🔴 Fulltime" if mode == "fulltime" else "🔵 Buffer"
-        mode_label = tk.Label(info, text=mode_text, font=("Segoe UI", 9),
+        mode_label = tk.Label(info, font=self._font_small,
                               bg=BG_MEDIUM, fg=FG_DIM, anchor="w")
         mode_label.pack(anchor="w")
         
         # Metadata
-        size_mb = size / (1024 * 1024) if size else 0
-        date_str = created_at[:16] if created_at else "Unknown"
-        meta_text = f"{size_mb:.1f} MB  •  {date_str}"
-        meta_label = tk.Label(info, text=meta_text, font=("Segoe UI", 9),
+        meta_label = tk.Label(info, font=self._font_small,
                               bg=BG_MEDIUM, fg=FG_DIM, anchor="w")
         meta_label.pack(anchor="w")
+        
+        window = self.canvas.create_window(
+            CARD_PADX, 0, window=outer, anchor="nw",
+            width=self._card_width(), state="hidden"
+        )
+        
+        return _Card(outer, window, thumb_label, name_label, mode_label, meta_label)
+    
+    def _show_row(self, card, index):
+        """Show row index on a card, touching only what changed."""
+        # Position the card first: binding may show a thumbnail right away,
+        # which only reaches cards that _visible_card() sees as in view
+        if card.index != index:
+            if card.index is None:
+                self.canvas.itemconfigure(card.window, state="normal")
+            self.canvas.coords(card.window, CARD_PADX, index * self._row_height)
+            card.index = index
+        
+        video = self.videos_data[index]
+        if card.video != video:
+            self._bind_card(card, index)
+    
+    def _hide_card(self, card):
+        """Hide a card that has no row in view and let go of its thumbnail."""
+        if card.index is not None:
+            self.canvas.itemconfigure(card.window, state="hidden")
+            card.thumb_label.configure(image="")
+            card.video = None  # Re-bind when shown again
+            card.index = None
+    
+    def _bind_card(self, card, index):
+        """Show a video row's data on a card."""
+        video = self.videos_data[index]
+        video_id, filename, filepath, _, _, _, thumbnail_path, _ = video
+        card.video = video
+        outer = card.outer
+        outer.video_id = video_id
+        outer.filepath = filepath
+        outer.configure(bg=HIGHLIGHT if video_id == self.selected_id else BG_DARK)
+        
+        mode_text, meta_text = self._row_texts[index]
+        card.name_label.configure(text=filename)
+        card.mode_label.configure(text=mode_text)
+        card.meta_label.configure(text=meta_text)
+        
+        # Reuse the decoded thumbnail unless it changed (e.g. was just generated)
+        cached = self._thumb_images.get(video_id)
+        if video_id in self._deleting:
+            card.thumb_label.configure(image="", text="Deleting…")
+        elif cached is not None and cached[0] == thumbnail_path:
+            self._show_thumbnail(card, self._photo_for(video_id, cached[1]))
+        else:
+            card.thumb_label.configure(image="", text="")
+            self._load_thumbnail(video_id, filename, thumbnail_path)
+    
+    def _visible_card(self, video_id):
+        """Get the card currently showing a video, or None if it's out of view."""
+        for card in self._card_pool:
+            if card.index is not None and card.video[0] == video_id:
+                return card
+        return None
+    
+    def _photo_for(self, video_id, img):
+        """Get the PhotoImage for a visible row, creating it on first show.
+        
+        Returns:
+            PhotoImage, or None if the video has no thumbnail
+        """
+        if img is None:
+            return None
+        photo = self.thumbnails.get(video_id)
+        if photo is None:
+            photo = ImageTk.PhotoImage(img)
+            self.thumbnails[video_id] = photo
+        return photo
+    
+    @staticmethod
+    def _render_no_preview():
+        """Draw the "No Preview" placeholder at thumbnail size.
+        
+        Returns:
+            PIL image
+        """
+        img = Image.new("RGB", THUMB_SIZE, BG_LIGHT)
+        draw = ImageDraw.Draw(img)
+        text = "No Preview"
+        left, top, right, bottom = draw.textbbox((0, 0), text)
+        x = (THUMB_SIZE[0] - (right - left)) // 2 - left
+        y = (THUMB_SIZE[1] - (bottom - top)) // 2 - top
+        draw.text((x, y), text, fill=FG_DIM)
+        return img
+    
+    def _show_thumbnail(self, card, photo):
+        """Show a thumbnail image, or the shared no-preview image, on a card."""
+        card.thumb_label.configure(image=photo if photo is not None else self._no_preview, text="")
+    
+    def _load_thumbnail(self, video_id, filename, thumbnail_path):
+        """Start loading a video's thumbnail in the background."""
+        pending = self._thumb_futures.get(video_id)
+        if pending is not None:
+            if pending[0] == thumbnail_path:
+                return  # Already loading
+            pending[1].cancel()
+            del self._thumb_futures[video_id]
+        
+        # A missing file is detected by the worker, not with a stat here
+        if not thumbnail_path:
+            self._set_thumbnail(video_id, thumbnail_path, None)
+            return
+        
+        future = self._thumb_pool.submit(self._decode_thumbnail, thumbnail_path)
+        future.add_done_callback(
+            lambda f: self.after(0, self._apply_thumbnail, video_id, filename, thumbnail_path, f)
+        )
+        self._thumb_futures[video_id] = (thumbnail_path, future)
+    
+    @staticmethod
+    def _decode_thumbnail(thumbnail_path):
+        """Decode a thumbnail at card size (runs on a worker thread).
+        
+        Returns:
+            PIL image, or None if the thumbnail file doesn't exist
+        """
+        try:
+            # Thumbnails are always written as JPEG; skip probing other formats
+            img = Image.open(thumbnail_path, formats=("JPEG",))
+        except FileNotFoundError:
+            return None
+        img.draft("RGB", THUMB_SIZE)  # Let libjpeg decode at a reduced scale
+        img.load()
+        # Don't resize if already correct size
+        if img.size != THUMB_SIZE:
+            img = img.resize(THUMB_SIZE, Image.Resampling.BILINEAR)
+        return img
+    
+    def _apply_thumbnail(self, video_id, filename, thumbnail_path, future):
+        """Cache a decoded thumbnail and show it if its row is in view (UI thread)."""
+        if self._thumb_futures.get(video_id, (None, None))[1] is not future:
+            return  # Video was removed or its thumbnail reloaded since
+        del self._thumb_futures[video_id]
+        
+        img = None
+        try:
+            img = future.result()
+        except Exception as e:
+            print(f"Thumbnail error for {filename}: {e}")
+        self._set_thumbnail(video_id, thumbnail_path, img)
+    
+    def _set_thumbnail(self, video_id, thumbnail_path, img):
+        """Remember a video's decoded thumbnail and update its card if visible."""
+        self._thumb_images[video_id] = (thumbnail_path, img)
+        self.thumbnails.pop(video_id, None)  # Stale if the thumbnail changed
+        card = self._visible_card(video_id)
+        if card is not None and video_id not in self._deleting:
+            self._show_thumbnail(card, self._photo_for(video_id, img))
+    
+    @staticmethod
+    def _card_of(widget):
+        """Get the outer card frame a clicked widget belongs to."""
+        while widget is not None and not hasattr(widget, "video_id"):
+            widget = widget.master
+        return widget
+    
+    def _on_card_click(self, event):
+        """Select the clicked card."""
+        outer = self._card_of(event.widget)
+        if outer is not None and outer.video_id is not None:
+            self._select_video(outer.video_id)
+    
+    def _on_card_double_click(self, event):
+        """Play the double-clicked card's video."""
+        outer = self._card_of(event.widget)
+        if outer is not None and outer.video_id is not None:
+            self._play_video(outer.filepath)
     
     def _select_video(self, video_id):
         """Select a video with visual feedback."""
-        # Deselect previous
-        if self.selected_id in self.video_frames:
-            self.video_frames[self.selected_id].configure(bg=BG_DARK)
-        
-        # Select new
         self.selected_id = video_id
-        if video_id in self.video_frames:
-            self.video_frames[video_id].configure(bg=HIGHLIGHT)  # Blue highlight
+        
+        # Only the visible cards can show the highlight
+        for card in self._card_pool:
+            if card.index is not None:
+                selected = card.video[0] == video_id
+                card.outer.configure(bg=HIGHLIGHT if selected else BG_DARK)  # Blue highlight
     
     def _play_video(self, filepath):
         """Open video in default player."""
@@ -195,11 +576,10 @@ class VideosTab(ttk.Frame):
     
     def _open_folder(self):
         """Open the recordings folder."""
-        from settings import get_settings
-        folder = get_settings().output_dir
-        if os.path.exists(folder):
-            os.startfile(folder)
-        else:
+        # Let the open itself report a missing folder instead of checking first
+        try:
+            os.startfile(get_settings().output_dir)
+        except FileNotFoundError:
             messagebox.showinfo("Info", "Recordings folder does not exist yet.")
     
     def _delete_selected(self):
@@ -208,8 +588,64 @@ class VideosTab(ttk.Frame):
             messagebox.showinfo("Info", "Please select a video first.")
             return
         
+        if self.selected_id in self._deleting:
+            return
+        
         if messagebox.askyesno("Confirm Delete", "Delete this video and its file?"):
-            db = get_database()
-            db.delete_video(self.selected_id, delete_file=True)
+            video_id = self.selected_id
             self.selected_id = None
+            
+            # Show the pending delete on the card; re-binding it (e.g. after
+            # scrolling) keeps showing it until the delete finishes
+            self._deleting.add(video_id)
+            card = self._visible_card(video_id)
+            if card is not None:
+                card.outer.configure(bg=BG_DARK)
+                card.thumb_label.configure(image="", text="Deleting…")
+            
+            db = get_database()
+            future = self._delete_pool.submit(db.delete_video, video_id, True)
+            future.add_done_callback(lambda f: self.after(0, self._on_deleted, video_id, f))
+    
+    def _on_deleted(self, video_id, future):
+        """Update the list once a delete has finished (runs on the UI thread)."""
+        self._deleting.discard(video_id)
+        try:
+            future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not delete video: {e}")
             self.refresh()
+            # Put the card's thumbnail back in place of "Deleting…"
+            card = self._visible_card(video_id)
+            if card is not None:
+                self._bind_card(card, card.index)
+            return
+        self._remove_row(video_id)
+    
+    def _remove_row(self, video_id):
+        """Drop a deleted video's row without reloading the list.
+        
+        The rows below shift up by one; only the cards now showing a
+        different row are re-bound. The next refresh() still reloads, since
+        the table signature no longer matches.
+        """
+        for index, video in enumerate(self.videos_data):
+            if video[0] == video_id:
+                break
+        else:
+            self.refresh()  # Not loaded; nothing to remove locally
+            return
+        
+        del self.videos_data[index]
+        del self._row_texts[index]
+        self._row_count -= 1
+        
+        self._thumb_images.pop(video_id, None)
+        self.thumbnails.pop(video_id, None)
+        pending = self._thumb_futures.pop(video_id, None)
+        if pending is not None:
+            pending[1].cancel()
+        
+        self._update_empty_label()
+        self._update_scrollregion()
+        self._render_visible()